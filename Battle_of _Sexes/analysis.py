@@ -1,6 +1,39 @@
 # analysis.py
+import os
+import sys
 from fractions import Fraction
 
+# The equilibrium solvers live in the main project one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from exact import ExactSolver
+
+def latex_number(value):
+    """A Fraction as LaTeX: an integer, or a signed \\frac"""
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    sign = "-" if value < 0 else ""
+    return f"{sign}\\frac{{{abs(value.numerator)}}}{{{value.denominator}}}"
+
+def indifference_steps(var, first, second, value):
+    """LaTeX steps showing that `var` = value equalises the payoff pairs `first` and `second`
+
+    Each pair holds a strategy's payoffs against the opponent's first and second
+    strategy; `var` is the probability of the opponent's first strategy and value
+    is its solution from ExactSolver.solve_2x2 (None when no value works).
+    """
+    slope = first[0] - first[1] - second[0] + second[1]
+    rhs = second[1] - first[1]
+    steps = [
+        rf"{var} \cdot {first[0]} + (1-{var}) \cdot {first[1]} = {var} \cdot {second[0]} + (1-{var}) \cdot {second[1]}",
+        rf"{slope}{var} = {rhs}"
+    ]
+    if value is None:
+        steps.append(rf"\text{{no value of }} {var} \text{{ gives indifference}}")
+    else:
+        steps.append(rf"{var} = {latex_number(value)}")
+    return steps
+
 def calculate_game_analysis():
     """Performs game-theoretic analysis and returns content for outputs."""
     payoffs = {
@@ -60,27 +93,20 @@ def calculate_game_analysis():
     pure_ne_result = "Pure NE: (Ballet, Ballet) and (Fight, Fight)."
     pure_ne.extend([bb_check, bf_check, fb_check, ff_check, pure_ne_result])
 
-    # 6. Mixed Strategy Nash Equilibrium
-    q = Fraction(2, 3)
-    q_steps = [
-        r"q \cdot 1 + (1-q) \cdot 0 = q \cdot 0 + (1-q) \cdot 2",
-        r"q = 2(1-q)",
-        r"q = 2 - 2q",
-        r"3q = 2",
-        r"q = \frac{2}{3}"
-    ]
-    p = Fraction(1, 3)
-    p_steps = [
-        r"2p \cdot 1 + (1-p) \cdot 0 = p \cdot 0 + (1-p) \cdot 1",
-        r"2p = 1-p",
-        r"3p = 1",
-        r"p = \frac{1}{3}"
-    ]
-    e_m = q
-    e_w = 2 * p
-    mixed_ne_result = (f"Mixed NE: Man plays Ballet with $p = {p}$, Fight with ${1-p}$; "
-                       f"Woman plays Ballet with $q = {q}$, Fight with ${1-q}$. "
-                       f"Expected payoffs: $E_M = {e_m}$, $E_W = {e_w}$.")
+    # 6. Mixed Strategy Nash Equilibrium (solved exactly from the payoffs)
+    # p (Man plays Ballet) makes Woman indifferent, q (Woman plays Ballet) makes Man indifferent
+    p, q = ExactSolver.solve_2x2([man_ballet, man_fight], [[woman_ballet[0], woman_fight[0]],
+                                                           [woman_ballet[1], woman_fight[1]]])
+    q_steps = indifference_steps("q", man_ballet, man_fight, q)
+    p_steps = indifference_steps("p", woman_ballet, woman_fight, p)
+    if p is not None and q is not None and 0 < p < 1 and 0 < q < 1:
+        e_m = q * man_ballet[0] + (1 - q) * man_ballet[1]
+        e_w = p * woman_ballet[0] + (1 - p) * woman_ballet[1]
+        mixed_ne_result = (f"Mixed NE: Man plays Ballet with $p = {p}$, Fight with ${1-p}$; "
+                           f"Woman plays Ballet with $q = {q}$, Fight with ${1-q}$. "
+                           f"Expected payoffs: $E_M = {e_m}$, $E_W = {e_w}$.")
+    else:
+        mixed_ne_result = "There is no fully mixed NE: the indifference conditions have no solution in (0, 1)."
 
     return {
         'dominated': dominated,
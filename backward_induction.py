@@ -0,0 +1,121 @@
+import numpy as np
+from game_tree import DECISION, CHANCE, TERMINAL
+
+
+class BackwardInduction:
+    """Subgame-perfect equilibria of perfect-information game trees
+
+    The tree is walked bottom-up in a single pass over an explicit-stack
+    ordering of the CSR child arrays, so there is no recursion and the work is
+    linear in the tree size. With memoize=True subtrees are hash-consed on the
+    way up: a node's key is (kind, player, payoffs or chance probabilities,
+    canonical ids of its children), so identical subtrees built separately share
+    one canonical representative and are solved once.
+    """
+
+    @staticmethod
+    def solve(tree, memoize=True):
+        """Solve a GameTree (or its to_arrays() dict)
+
+        Returns 'value' (n, N) subgame values, 'choice' (n,) the index of the
+        chosen child at each decision node (-1 elsewhere), 'root_value' and
+        'unique_subtrees', the number of structurally distinct subtrees solved.
+        """
+        arrays = tree if isinstance(tree, dict) else tree.to_arrays()
+        kind, player, payoffs = arrays['kind'], arrays['player'], arrays['payoffs']
+        child_start = arrays['child_start']
+        n = len(kind)
+        counts = np.diff(child_start)
+
+        decision = kind == DECISION
+        if np.any(decision & (counts == 0)) or np.any(decision & (player < 0)):
+            raise ValueError("Every decision node needs a player and at least one action")
+        if np.any((kind == TERMINAL) & np.isnan(payoffs).any(axis=1)):
+            raise ValueError("Every terminal node needs a full payoff vector")
+        infosets = arrays['infoset'][decision]
+        if len(np.unique(infosets)) < len(infosets):
+            raise ValueError("Backward induction needs perfect information (singleton information sets)")
+
+        # Plain lists are much faster than NumPy scalars inside the node loop
+        kinds, players, starts = kind.tolist(), player.tolist(), child_start.tolist()
+        child, probability = arrays['child'].tolist(), arrays['probability'].tolist()
+        terminal_payoffs = payoffs.tolist()
+        root = int(np.flatnonzero(arrays['parent'] == -1)[0])
+
+        values = [None] * n
+        choice = [-1] * n
+        canonical = list(range(n))
+        signatures = {}
+        for node in BackwardInduction._postorder(root, starts, child):
+            kids = child[starts[node]:starts[node + 1]]
+            if memoize:
+                # Children are already reduced to their canonical representatives
+                if kinds[node] == TERMINAL:
+                    content = tuple(terminal_payoffs[node])
+                elif kinds[node] == CHANCE:
+                    content = tuple(probability[starts[node]:starts[node + 1]])
+                else:
+                    content = None
+                key = (kinds[node], players[node], content, tuple(canonical[c] for c in kids))
+                known = signatures.setdefault(key, node)
+                if known != node:
+                    canonical[node] = known
+                    values[node], choice[node] = values[known], choice[known]
+                    continue
+
+            if kinds[node] == TERMINAL:
+                values[node] = tuple(terminal_payoffs[node])
+            elif kinds[node] == CHANCE:
+                probs = probability[starts[node]:starts[node + 1]]
+                values[node] = tuple(sum(p * values[c][i] for p, c in zip(probs, kids))
+                                     for i in range(len(terminal_payoffs[node])))
+            else:
+                # First child that maximises the mover's payoff
+                mover = players[node]
+                best = 0
+                for k in range(1, len(kids)):
+                    if values[kids[k]][mover] > values[kids[best]][mover]:
+                        best = k
+                choice[node] = best
+                values[node] = values[kids[best]]
+
+        value = np.full(payoffs.shape, np.nan)
+        reached = [node for node in range(n) if values[node] is not None]
+        value[reached] = [values[node] for node in reached]
+        return {
+            'value': value,
+            'choice': np.array(choice, dtype=np.int64),
+            'root_value': values[root],
+            'unique_subtrees': len(signatures) if memoize else len(reached)
+        }
+
+    @staticmethod
+    def _postorder(root, starts, child):
+        """Nodes below root with every child before its parent, using an explicit stack"""
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(child[starts[node]:starts[node + 1]])
+        # Reversed preorder visits each child before its parent
+        order.reverse()
+        return order
+
+    @staticmethod
+    def strategy(tree, result):
+        """{decision node id: chosen action label} from a solve() result"""
+        return {
+            tree.name(node): tree.actions(node)[result['choice'][node]]
+            for node in np.flatnonzero(result['choice'] >= 0).tolist()
+        }
+
+    @staticmethod
+    def equilibrium_path(tree, result):
+        """Action labels along the equilibrium path from the root (chance nodes are not followed)"""
+        path = []
+        node = tree.root
+        while result['choice'][node] >= 0:
+            path.append(tree.actions(node)[result['choice'][node]])
+            node = int(tree.children(node)[result['choice'][node]])
+        return path
@@ -0,0 +1,229 @@
+import argparse
+import json
+import os
+import sys
+from itertools import islice
+import numpy as np
+from payoff_tensor import PayoffTensor
+from game_analyzer import GameAnalyzer
+from registry import GameRegistry
+
+
+class BatchAnalyzer:
+    """Non-interactive analysis of many games, streamed as JSON Lines
+
+    A spec is a dict naming either a bundled game, {"game": "hawk_dove",
+    "params": {"value": 4, "cost": 2}}, or a custom one, {"strategies": [[...],
+    ...], "payoffs": nested list of shape (n_1, ..., n_N, N)} or a "table" of
+    [profile, payoffs] pairs. "analyses" picks what to compute and "id" is
+    echoed back. Nothing is drawn here; see render().
+    """
+
+    ANALYSES = ('pure', 'mixed', 'zero_sum', 'dominance', 'correlated')
+    DEFAULT_ANALYSES = ('pure', 'mixed')
+
+    @staticmethod
+    def read_specs(paths, fmt=None):
+        """Yield specs from .json/.jsonl/.yaml/.npz files, '-' meaning stdin, in order
+
+        JSON Lines and YAML are parsed one line or document at a time, so specs
+        piped on stdin are analyzed while later ones are still arriving. A JSON
+        file that is not JSON Lines is one document and is parsed whole.
+        """
+        for path in paths or ['-']:
+            if path == '-':
+                yield from BatchAnalyzer._parse_stream(sys.stdin, fmt or 'json')
+            elif (fmt or os.path.splitext(path)[1].lstrip('.')) == 'npz':
+                yield from BatchAnalyzer._read_npz(path)
+            else:
+                with open(path) as handle:
+                    yield from BatchAnalyzer._parse_stream(handle, fmt or os.path.splitext(path)[1].lstrip('.'))
+
+    @staticmethod
+    def _parse_stream(handle, fmt):
+        if fmt in ('yaml', 'yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("Reading YAML specs needs PyYAML; use JSON instead") from None
+            documents = (document for document in yaml.safe_load_all(handle) if document is not None)
+        elif fmt == 'jsonl':
+            documents = (json.loads(line) for line in handle if line.strip())
+        elif fmt == 'json':
+            documents = BatchAnalyzer._json_documents(handle)
+        else:
+            raise ValueError(f"Unsupported spec format: {fmt}")
+        for document in documents:
+            yield from (document if isinstance(document, list) else [document])
+
+    @staticmethod
+    def _json_documents(handle):
+        """One JSON document, or one per line when the first line is already a complete document"""
+        first = handle.readline()
+        while first and not first.strip():
+            first = handle.readline()
+        try:
+            document = json.loads(first)
+        except json.JSONDecodeError:
+            yield json.loads(first + handle.read())
+            return
+        yield document
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+    @staticmethod
+    def _read_npz(path):
+        """Specs from an .npz holding 'payoffs' for one game or a stack of equally shaped games
+
+        Optional arrays: 'strategies_<player>' with strategy names and 'ids'.
+        """
+        data = np.load(path)
+        payoffs = data['payoffs']
+        games = payoffs if payoffs.ndim == payoffs.shape[-1] + 2 else payoffs[np.newaxis]
+        strategies = [data[f'strategies_{p}'].tolist() if f'strategies_{p}' in data else None
+                      for p in range(games.shape[-1])]
+        ids = data['ids'].tolist() if 'ids' in data else None
+        for k, game in enumerate(games):
+            yield {
+                'id': ids[k] if ids is not None else f"{path}:{k}",
+                'strategies': [s or [f"s{i}" for i in range(n)] for s, n in zip(strategies, game.shape[:-1])],
+                'payoffs': game
+            }
+
+    @staticmethod
+    def build_game(spec):
+        """A bundled Game instance or a PayoffTensor for a custom spec"""
+        if 'game' in spec:
+            return GameRegistry.create(spec['game'], **spec.get('params', {}))
+        if 'table' in spec:
+            table = {tuple(profile): tuple(payoffs) for profile, payoffs in spec['table']}
+            return PayoffTensor.from_dict(table, spec.get('strategies'))
+        return PayoffTensor(spec['strategies'], spec['payoffs'])
+
+    @staticmethod
+    def analyze(spec, index=None):
+        """Result record for one spec; failures are reported in an 'error' field instead of raised
+
+        The record's id is the spec's own 'id', else its position index in the input.
+        """
+        record = {'id': index}
+        try:
+            if not isinstance(spec, dict):
+                raise TypeError(f"A spec must be an object (mapping), got {type(spec).__name__}")
+            record['id'] = spec.get('id', index)
+            game = PayoffTensor.from_game(BatchAnalyzer.build_game(spec))
+            analyses = spec.get('analyses', BatchAnalyzer.DEFAULT_ANALYSES)
+            unknown = set(analyses) - set(BatchAnalyzer.ANALYSES)
+            if unknown:
+                raise ValueError(f"Unknown analyses {sorted(unknown)}, expected some of {BatchAnalyzer.ANALYSES}")
+
+            record['players'] = game.num_players
+            record['strategies'] = game.strategies
+            record['hash'] = game.content_hash()
+            two_player = game.num_players == 2
+            for analysis in analyses:
+                if analysis == 'pure':
+                    record['pure'] = GameAnalyzer.find_pure_strategy_equilibria(game)
+                elif analysis == 'mixed':
+                    record['mixed'] = GameAnalyzer.find_mixed_strategy_equilibrium(game) if two_player else None
+                elif analysis == 'zero_sum':
+                    zero_sum = two_player and GameAnalyzer.is_constant_sum(game)
+                    record['zero_sum'] = GameAnalyzer.solve_zero_sum(game) if zero_sum else None
+                elif analysis == 'dominance':
+                    reduced, trace = GameAnalyzer.eliminate_dominated_strategies(game)
+                    record['dominance'] = {'surviving': reduced.strategies, 'eliminated': trace}
+                elif analysis == 'correlated':
+                    solution = GameAnalyzer.find_correlated_equilibrium(game)
+                    solution['distribution'] = [[list(profile), p] for profile, p in solution['distribution'].items()]
+                    record['correlated'] = solution
+        except Exception as error:
+            record['error'] = f"{type(error).__name__}: {error}"
+        return record
+
+    @staticmethod
+    def _analyze_chunk(indexed_specs):
+        return [BatchAnalyzer.analyze(spec, index) for index, spec in indexed_specs]
+
+    @staticmethod
+    def run(specs, processes=None, chunk_size=64):
+        """Yield one result per spec, in input order, as soon as its chunk is done
+
+        Specs are read lazily in chunks of chunk_size; unless processes=1 the
+        chunks are analyzed across a process pool with a bounded number in flight.
+        """
+        specs = enumerate(specs)
+        chunks = iter(lambda: list(islice(specs, chunk_size)), [])
+        if processes == 1:
+            for chunk in chunks:
+                yield from BatchAnalyzer._analyze_chunk(chunk)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+        workers = processes or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = [pool.submit(BatchAnalyzer._analyze_chunk, chunk) for chunk in islice(chunks, 2 * workers)]
+            while pending:
+                results = pending.pop(0).result()
+                for chunk in islice(chunks, 1):
+                    pending.append(pool.submit(BatchAnalyzer._analyze_chunk, chunk))
+                yield from results
+
+    @staticmethod
+    def render(specs, directory, skip=()):
+        """Draw the extensive form of every bundled game spec to <directory>/<id>.png, except ids in skip"""
+        os.makedirs(directory, exist_ok=True)
+        for k, spec in enumerate(specs):
+            if not isinstance(spec, dict) or 'game' not in spec or spec.get('id', k) in skip:
+                continue
+            game = GameRegistry.create(spec['game'], **spec.get('params', {}))
+            if hasattr(game, 'extensive_form'):
+                name = str(spec.get('id', k)).replace(os.sep, '_')
+                game.extensive_form().draw(name, path=os.path.join(directory, f"{name}.png"))
+
+
+def _jsonable(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, set):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze game specs in batch and stream JSON Lines results")
+    parser.add_argument('inputs', nargs='*', help="spec files (.json, .jsonl, .yaml, .npz); '-' or none reads stdin")
+    parser.add_argument('--format', choices=['json', 'jsonl', 'yaml', 'npz'],
+                        help="spec format, by default taken from the file extension (stdin defaults to json)")
+    parser.add_argument('-o', '--output', help="write results here instead of stdout")
+    parser.add_argument('-j', '--processes', type=int, help="worker processes (1 runs in this process)")
+    parser.add_argument('--chunk-size', type=int, default=64, help="specs per worker task")
+    parser.add_argument('--render', metavar='DIR', help="afterwards, draw bundled games' extensive forms into DIR")
+    args = parser.parse_args(argv)
+
+    specs = BatchAnalyzer.read_specs(args.inputs, args.format)
+    if args.render:
+        # Rendering is a separate pass afterwards, so the specs are kept
+        specs = list(specs)
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    failures = []
+    try:
+        for record in BatchAnalyzer.run(specs, args.processes, args.chunk_size):
+            if 'error' in record:
+                failures.append(record['id'])
+            out.write(json.dumps(record, default=_jsonable) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.render:
+        BatchAnalyzer.render(specs, args.render, skip=set(failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
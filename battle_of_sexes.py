@@ -1,6 +1,8 @@
+from game import Game
 from game_tree import GameTree
+from game_analyzer import GameAnalyzer
 
-class BattleOfTheSexes:
+class BattleOfTheSexes(Game):
     def __init__(self):
         self.payoffs = {
             ('Opera', 'Opera'): (3, 2),
@@ -12,26 +14,13 @@ class BattleOfTheSexes:
         self.strategies = ['Opera', 'Football']
     
     def find_nash_equilibrium(self):
-        pure_nash = [('Opera', 'Opera'), ('Football', 'Football')]
-        mixed_nash = {
-            'Player 1': {'Opera': 0.4, 'Football': 0.6},
-            'Player 2': {'Opera': 0.6, 'Football': 0.4}
-        }
+        pure_nash = GameAnalyzer.find_pure_strategy_equilibria(self)
+        mixed_nash = GameAnalyzer.find_mixed_strategy_equilibrium(self)
         return {'pure': pure_nash, 'mixed': mixed_nash}
     
     def calculate_expected_payoffs(self, mixed_strategy):
-        p1_strat = mixed_strategy['Player 1']
-        p2_strat = mixed_strategy['Player 2']
-        
-        p1_payoff = p2_payoff = 0
-        
-        for s1, prob1 in p1_strat.items():
-            for s2, prob2 in p2_strat.items():
-                payoff = self.payoffs[(s1, s2)]
-                p1_payoff += prob1 * prob2 * payoff[0]
-                p2_payoff += prob1 * prob2 * payoff[1]
-        
-        return (p1_payoff, p2_payoff)
+        return tuple(GameAnalyzer.calculate_expected_payoffs(
+            self, {0: mixed_strategy['Player 1'], 1: mixed_strategy['Player 2']}))
     
     def display_normal_form(self):
         print("Battle of the Sexes - Normal Form")
@@ -41,17 +30,23 @@ class BattleOfTheSexes:
         print(f"Football\t{self.payoffs[('Football','Opera')]}\t{self.payoffs[('Football','Football')]}")
 
     def display_extensive_form(self):
+        self.extensive_form().draw("Battle of the Sexes - Extensive Form")
+    
+    def extensive_form(self):
+        """Game tree with real payoffs; Player 2 moves without seeing Player 1's choice"""
         tree = GameTree()
         tree.level_height = 1.5
         
         # Root node
-        tree.add_node("root", "Player 1", level=0)
+        tree.add_node("root", "Player 1", level=0, player=0)
         
         # Player 1 actions
-        tree.add_node("P1_O", "Opera", level=1, position=(-1.5, -1))
-        tree.add_node("P1_F", "Football", level=1, position=(1.5, -1))
-        tree.add_edge("root", "P1_O", "Opera")
-        tree.add_edge("root", "P1_F", "Football")
+        tree.add_node("P1_O", "Opera", level=1, position=(-1.5, -1),
+                      player=1, infoset="P2")
+        tree.add_node("P1_F", "Football", level=1, position=(1.5, -1),
+                      player=1, infoset="P2")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_O"), "Opera")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_F"), "Football")
         
         # Player 2 actions
         for p1_action, x_pos in [("O", -1.5), ("F", 1.5)]:
@@ -59,11 +54,11 @@ class BattleOfTheSexes:
                 node_id = f"P2_{p1_action}_{p2_action}"
                 payoff = self._get_payoff_for_tree(p1_action, p2_action)
                 tree.add_node(node_id, f"Payoff: {payoff}", level=2, 
-                            position=(x_pos + (0.8 if p2_action == "F" else -0.8), -2.5))
-                tree.add_edge(f"P1_{p1_action}", node_id, 
+                            position=(x_pos + (0.8 if p2_action == "F" else -0.8), -2.5), payoffs=payoff)
+                tree.add_edge(tree.id_of(f"P1_{p1_action}"), tree.id_of(node_id), 
                             "Opera" if p2_action == "O" else "Football")
         
-        tree.draw("Battle of the Sexes - Extensive Form")
+        return tree
     
     def _get_payoff_for_tree(self, p1_action, p2_action):
         p1_strat = "Opera" if p1_action == "O" else "Football"
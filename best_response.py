@@ -0,0 +1,98 @@
+import numpy as np
+from collections import OrderedDict
+from payoff_tensor import PayoffTensor
+
+
+class BestResponseOracle:
+    """Best-response tables for every player of a game, built once and queried in O(1)"""
+
+    CACHE_SIZE = 128
+    # id(dict) -> (dict, len(dict), oracle); holding the dict keeps its id from being reused
+    _cache = OrderedDict()
+
+    def __init__(self, game):
+        self.game = game
+        self.masks = []
+        self.tables = []
+
+        for player in range(game.num_players):
+            # Move the player's own axis last: leading axes index opponent profiles
+            payoffs = np.moveaxis(game.player_payoffs(player), player, -1)
+            mask = payoffs >= payoffs.max(axis=-1, keepdims=True)
+            self.masks.append(mask)
+
+            # Every tied maximizer is kept, grouped per opponent profile in C order
+            opp_shape = mask.shape[:-1]
+            flat_mask = mask.reshape(-1, mask.shape[-1])
+            best = np.nonzero(flat_mask)[1]
+            splits = np.cumsum(flat_mask.sum(axis=1))[:-1]
+            strategies = game.strategies[player]
+            table = np.empty(flat_mask.shape[0], dtype=object)
+            for row, group in enumerate(np.split(best, splits)):
+                table[row] = tuple(strategies[k] for k in group)
+            self.tables.append(table.reshape(opp_shape))
+
+    @classmethod
+    def for_game(cls, payoff_matrix):
+        """Return the oracle for a dict, game or PayoffTensor without rebuilding it for the same game
+
+        A tensor (or a game, through its cached tensor) keeps its oracle in
+        PayoffTensor.cached(), so a repeat query is O(1) and a change made through
+        set_payoff() or touch() rebuilds it. Dicts go to an LRU cache keyed by the
+        dict's identity and size, which is also O(1); a dict whose values are
+        changed in place is not noticed, so mutable games should be passed as a
+        Game or PayoffTensor.
+        """
+        if not isinstance(payoff_matrix, dict):
+            return PayoffTensor.from_game(payoff_matrix).cached('best_response_oracle', cls)
+
+        key = id(payoff_matrix)
+        entry = cls._cache.get(key)
+        if entry is not None and entry[1] == len(payoff_matrix):
+            cls._cache.move_to_end(key)
+            return entry[2]
+        oracle = cls(PayoffTensor.from_dict(payoff_matrix))
+        cls._cache[key] = (payoff_matrix, len(payoff_matrix), oracle)
+        cls._cache.move_to_end(key)
+        if len(cls._cache) > cls.CACHE_SIZE:
+            cls._cache.popitem(last=False)
+        return oracle
+
+    def best_responses(self, player, opponent_strategy):
+        """All best responses of a player to the opponents' pure strategies (in player order)"""
+        opponents = [p for p in range(self.game.num_players) if p != player]
+        idx = tuple(self.game.index[p][s] for p, s in zip(opponents, opponent_strategy))
+        return self.tables[player][idx]
+
+    def best_response(self, player, opponent_strategy):
+        return self.best_responses(player, opponent_strategy)[0]
+
+    def expected_payoffs_against(self, player, beliefs):
+        """Expected payoff of each of a player's strategies against the opponents' mixed strategies
+
+        beliefs lists one probability vector (or {strategy: prob} dict) per opponent, in player order.
+        """
+        opponents = [p for p in range(self.game.num_players) if p != player]
+        payoffs = np.moveaxis(self.game.player_payoffs(player), player, -1)
+        for p, belief in zip(opponents, beliefs):
+            if isinstance(belief, dict):
+                probs = np.zeros(self.game.shape[p])
+                for strategy, prob in belief.items():
+                    probs[self.game.index[p][strategy]] = prob
+                belief = probs
+            # Contract the leading opponent axis; with two players this is one matrix-vector product
+            payoffs = np.tensordot(belief, payoffs, axes=(0, 0))
+        return payoffs
+
+    def best_responses_to_mixed(self, player, beliefs, tol=1e-9):
+        """All best responses of a player to the opponents' mixed strategies"""
+        values = self.expected_payoffs_against(player, beliefs)
+        best = np.flatnonzero(values >= values.max() - tol)
+        return tuple(self.game.strategies[player][k] for k in best)
+
+    def pure_equilibria(self):
+        """Profiles where every player is best responding, in C order of the tensor"""
+        is_equilibrium = np.ones(self.game.shape, dtype=bool)
+        for player, mask in enumerate(self.masks):
+            is_equilibrium &= np.moveaxis(mask, -1, player)
+        return [self.game.profile_names(idx) for idx in zip(*np.nonzero(is_equilibrium))]
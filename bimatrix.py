@@ -0,0 +1,171 @@
+import numpy as np
+from itertools import combinations
+
+
+class BimatrixSolver:
+    """Nash equilibria of 2-player games given as payoff matrices A (row) and B (column)"""
+
+    TOL = 1e-9
+
+    @staticmethod
+    def lemke_howson(A, B, initial_dropped_label=0, max_pivots=10000):
+        """Find one equilibrium by complementary pivoting from the artificial equilibrium"""
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float)
+        m, n = A.shape
+        if not 0 <= initial_dropped_label < m + n:
+            raise ValueError(f"Dropped label must lie in [0, {m + n})")
+
+        # Shift payoffs to be strictly positive so both polytopes are bounded
+        A = A - A.min() + 1
+        B = B - B.min() + 1
+
+        # Labels 0..m-1 are row strategies, m..m+n-1 are column strategies.
+        # Row tableau: B^T x + s = 1 (x labelled 0..m-1, slacks m..m+n-1)
+        # Column tableau: A y + r = 1 (slacks labelled 0..m-1, y m..m+n-1)
+        row_tableau = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+        col_tableau = np.hstack([np.eye(m), A, np.ones((m, 1))])
+        row_basis = list(range(m, m + n))
+        col_basis = list(range(m))
+        row_slacks = list(range(m, m + n))
+        col_slacks = list(range(m))
+
+        entering = initial_dropped_label
+        in_row_tableau = entering < m
+        for _ in range(max_pivots):
+            if in_row_tableau:
+                leaving = BimatrixSolver._pivot(row_tableau, row_basis, row_slacks, entering)
+            else:
+                leaving = BimatrixSolver._pivot(col_tableau, col_basis, col_slacks, entering)
+            if leaving == initial_dropped_label:
+                break
+            # The label that just left is now duplicated, so it enters the other tableau
+            entering = leaving
+            in_row_tableau = not in_row_tableau
+        else:
+            raise RuntimeError("Lemke-Howson did not terminate; the game may be degenerate")
+
+        x = np.zeros(m)
+        for row, label in enumerate(row_basis):
+            if label < m:
+                x[label] = row_tableau[row, -1]
+        y = np.zeros(n)
+        for row, label in enumerate(col_basis):
+            if label >= m:
+                y[label - m] = col_tableau[row, -1]
+        return x / x.sum(), y / y.sum()
+
+    @staticmethod
+    def _pivot(tableau, basis, slack_columns, entering):
+        """Pivot a column into the basis with a lexicographic ratio test, return the leaving label"""
+        column = tableau[:, entering]
+        candidates = np.flatnonzero(column > BimatrixSolver.TOL)
+        if len(candidates) == 0:
+            raise RuntimeError("Unbounded pivot column in Lemke-Howson")
+
+        # Lexicographic minimum ratio keeps degenerate games from cycling
+        for col in [-1] + slack_columns:
+            ratios = tableau[candidates, col] / column[candidates]
+            candidates = candidates[ratios <= ratios.min() + BimatrixSolver.TOL]
+            if len(candidates) == 1:
+                break
+        row = candidates[0]
+
+        tableau[row] /= tableau[row, entering]
+        others = np.arange(len(tableau)) != row
+        tableau[others] -= np.outer(tableau[others, entering], tableau[row])
+
+        leaving = basis[row]
+        basis[row] = entering
+        return leaving
+
+    @staticmethod
+    def support_enumeration(A, B, max_support=None, prune=True):
+        """Yield every equilibrium (x, y) of a nondegenerate game by enumerating equal-size supports"""
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float)
+        m, n = A.shape
+        tol = BimatrixSolver.TOL
+
+        rows, cols = np.arange(m), np.arange(n)
+        if prune:
+            # Strictly dominated strategies never appear in any equilibrium support
+            rows, cols = BimatrixSolver._undominated(A, B)
+        max_support = min(len(rows), len(cols), max_support or max(m, n))
+
+        found = []
+        for size in range(1, max_support + 1):
+            for I in combinations(rows, size):
+                I = list(I)
+                # Columns strictly dominated against the rows in I cannot be in the support
+                allowed_cols = cols
+                if prune:
+                    allowed_cols = [j for j in cols if not BimatrixSolver._conditionally_dominated(B[I].T, j, cols)]
+                for J in combinations(allowed_cols, size):
+                    J = list(J)
+                    if prune and any(BimatrixSolver._conditionally_dominated(A[:, J], i, rows) for i in I):
+                        continue
+
+                    y = BimatrixSolver._indifferent_strategy(A[np.ix_(I, J)])
+                    x = BimatrixSolver._indifferent_strategy(B[np.ix_(I, J)].T)
+                    if x is None or y is None:
+                        continue
+
+                    full_x = np.zeros(m)
+                    full_x[I] = x
+                    full_y = np.zeros(n)
+                    full_y[J] = y
+
+                    # No strategy outside the support may do strictly better
+                    row_values = A @ full_y
+                    col_values = full_x @ B
+                    if row_values.max() > row_values[I].max() + tol or col_values.max() > col_values[J].max() + tol:
+                        continue
+                    if any(np.allclose(full_x, fx) and np.allclose(full_y, fy) for fx, fy in found):
+                        continue
+                    found.append((full_x, full_y))
+                    yield full_x, full_y
+
+    @staticmethod
+    def _indifferent_strategy(M):
+        """Mixed strategy over M's columns that makes every row of M equally good, or None"""
+        size = M.shape[0]
+        # Unknowns: probabilities for each column plus the common value v
+        system = np.zeros((size + 1, size + 1))
+        system[:size, :size] = M
+        system[:size, size] = -1
+        system[size, :size] = 1
+        rhs = np.zeros(size + 1)
+        rhs[size] = 1
+        try:
+            solution = np.linalg.solve(system, rhs)
+        except np.linalg.LinAlgError:
+            return None
+        probs = solution[:size]
+        if np.any(probs < -BimatrixSolver.TOL):
+            return None
+        return np.clip(probs, 0, None)
+
+    @staticmethod
+    def _conditionally_dominated(M, i, candidates):
+        """Is row i of M strictly dominated by another candidate row (columns are the opponent's support)"""
+        return any(np.all(M[k] > M[i]) for k in candidates if k != i)
+
+    @staticmethod
+    def _undominated(A, B):
+        """Iteratively remove strictly dominated pure strategies for both players"""
+        rows, cols = list(range(A.shape[0])), list(range(A.shape[1]))
+        changed = True
+        while changed:
+            changed = False
+            sub_A = A[np.ix_(rows, cols)]
+            keep = [r for k, r in enumerate(rows)
+                    if not BimatrixSolver._conditionally_dominated(sub_A, k, range(len(rows)))]
+            if len(keep) < len(rows):
+                rows, changed = keep, True
+            sub_B = B[np.ix_(rows, cols)].T
+            keep = [c for k, c in enumerate(cols)
+                    if not BimatrixSolver._conditionally_dominated(sub_B, k, range(len(cols)))]
+            if len(keep) < len(cols):
+                cols, changed = keep, True
+        return rows, cols
@@ -0,0 +1,434 @@
+import os
+import numpy as np
+from game_tree import DECISION, CHANCE, TERMINAL
+
+
+class CFRSolver:
+    """Counterfactual regret minimization on imperfect-information GameTrees
+
+    Every information set owns a contiguous block of "slots", one per action, in
+    flat regret and strategy-sum arrays. 'cfr' and 'cfr+' sweep the whole tree
+    each iteration with vectorized passes over its depth levels. The sampling
+    variants, 'outcome_sampling' and 'external_sampling', walk one sampled part
+    of the tree per sample; batches of samples can run in worker processes that
+    return regret increments, which are summed into the tables after each round.
+    """
+
+    METHODS = ('cfr', 'cfr+', 'outcome_sampling', 'external_sampling')
+
+    def __init__(self, tree):
+        arrays = tree if isinstance(tree, dict) else tree.to_arrays()
+        self.tree = None if isinstance(tree, dict) else tree
+        self.kind, self.player = arrays['kind'], arrays['player']
+        self.child_start, self.child = arrays['child_start'], arrays['child']
+        self.probability, self.payoffs = arrays['probability'], arrays['payoffs']
+        self.num_players = self.payoffs.shape[1]
+        n = len(self.kind)
+        counts = np.diff(self.child_start)
+
+        decision = np.flatnonzero(self.kind == DECISION)
+        if np.any(self.player[decision] < 0):
+            raise ValueError("Every decision node needs a player")
+        # Renumber information sets 0..I-1 and lay their actions out in slots
+        self.infoset_ids, compact = np.unique(arrays['infoset'][decision], return_inverse=True)
+        self.node_infoset = np.full(n, -1, dtype=np.int64)
+        self.node_infoset[decision] = compact
+        num_infosets = len(self.infoset_ids)
+        self.num_actions = np.zeros(num_infosets, dtype=np.int64)
+        self.num_actions[compact] = counts[decision]
+        if np.any(self.num_actions[compact] != counts[decision]) or np.any(self.num_actions == 0):
+            raise ValueError("Nodes of one information set must all have the same, nonzero number of actions")
+        self.infoset_player = np.zeros(num_infosets, dtype=np.int64)
+        self.infoset_player[compact] = self.player[decision]
+        self.infoset_start = np.zeros(num_infosets + 1, dtype=np.int64)
+        np.cumsum(self.num_actions, out=self.infoset_start[1:])
+        self.slot_infoset = np.repeat(np.arange(num_infosets), self.num_actions)
+        self.num_slots = int(self.infoset_start[-1])
+
+        # Per-edge views in CSR order
+        self.edge_parent = np.repeat(np.arange(n), counts)
+        rank = np.arange(len(self.child)) - self.child_start[self.edge_parent]
+        on_decision = self.kind[self.edge_parent] == DECISION
+        self.edge_slot = np.where(on_decision, self.infoset_start[np.maximum(self.node_infoset[self.edge_parent], 0)] + rank, -1)
+        self.edge_actor = np.where(on_decision, self.player[self.edge_parent], self.num_players)
+        self.decision_edges = np.flatnonzero(on_decision)
+        self.chance_edges = np.flatnonzero(self.kind[self.edge_parent] == CHANCE)
+
+        self.root = int(np.flatnonzero(arrays['parent'] == -1)[0])
+        self.depth, self.levels = self._levels()
+
+        self.regrets = np.zeros(self.num_slots)
+        self.strategy_sum = np.zeros(self.num_slots)
+        self.iterations = 0
+
+    def _levels(self):
+        """Depth of each node and, per depth, the CSR edge range data of nodes at that depth"""
+        depth = np.full(len(self.kind), -1, dtype=np.int64)
+        levels = []
+        frontier = np.array([self.root])
+        d = 0
+        while len(frontier):
+            depth[frontier] = d
+            frontier = np.sort(frontier[self.child_start[frontier + 1] > self.child_start[frontier]])
+            if not len(frontier):
+                break
+            sizes = self.child_start[frontier + 1] - self.child_start[frontier]
+            starts = np.cumsum(sizes) - sizes
+            edges = np.repeat(self.child_start[frontier] - starts, sizes) + np.arange(sizes.sum())
+            levels.append((frontier, edges, starts))
+            frontier = self.child[edges]
+            d += 1
+        return depth, levels
+
+    def current_strategy(self, regrets=None):
+        """Regret-matching strategy over all slots (uniform where no regret is positive)"""
+        positive = np.maximum(self.regrets if regrets is None else regrets, 0)
+        totals = np.add.reduceat(positive, self.infoset_start[:-1]) if self.num_slots else positive
+        totals = totals[self.slot_infoset]
+        uniform = 1.0 / self.num_actions[self.slot_infoset]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(totals > 0, positive / totals, uniform)
+
+    def average_strategy(self):
+        """Average strategy over all slots, the quantity that converges to equilibrium"""
+        totals = np.add.reduceat(self.strategy_sum, self.infoset_start[:-1])[self.slot_infoset]
+        uniform = 1.0 / self.num_actions[self.slot_infoset]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(totals > 0, self.strategy_sum / totals, uniform)
+
+    def solve(self, iterations=1000, method='cfr+', processes=1, batch=1000, epsilon=0.6, seed=None):
+        """Run the chosen CFR variant and return {'policy', 'nash_conv', 'iterations'}
+
+        For the sampling methods one iteration is one sample per player, and
+        with processes other than 1 the samples are split into rounds of
+        `batch` samples per worker. Workers see the regrets as of the start of
+        a round, so batches should stay small next to the number of
+        information sets.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown CFR method '{method}', expected one of {self.METHODS}")
+
+        if method in ('cfr', 'cfr+'):
+            for _ in range(iterations):
+                self._full_iteration(plus=method == 'cfr+')
+        else:
+            self._sampled_iterations(method, iterations, processes, batch, epsilon, seed)
+
+        strategy = self.average_strategy()
+        return {'policy': self.policy(strategy), 'nash_conv': self.nash_conv(strategy),
+                'iterations': self.iterations}
+
+    def _full_iteration(self, plus):
+        """One alternating-update iteration of vanilla CFR or CFR+"""
+        self.iterations += 1
+        for traverser in range(self.num_players):
+            sigma = self.current_strategy()
+            reach, values = self._reach(sigma), self._values(sigma)
+
+            edges = self.decision_edges[self.edge_actor[self.decision_edges] == traverser]
+            parents, slots = self.edge_parent[edges], self.edge_slot[edges]
+            others = np.prod(np.delete(reach[parents], traverser, axis=1), axis=1)
+            gains = others * (values[self.child[edges], traverser] - values[parents, traverser])
+            self.regrets += np.bincount(slots, gains, minlength=self.num_slots)
+            if plus:
+                np.maximum(self.regrets, 0, out=self.regrets)
+
+            # CFR+ weights the average linearly in the iteration number
+            weight = self.iterations if plus else 1
+            own = reach[parents, traverser] * sigma[slots] * weight
+            self.strategy_sum += np.bincount(slots, own, minlength=self.num_slots)
+
+    def _edge_weights(self, sigma):
+        weights = np.zeros(len(self.child))
+        weights[self.decision_edges] = sigma[self.edge_slot[self.decision_edges]]
+        weights[self.chance_edges] = self.probability[self.chance_edges]
+        return weights
+
+    def _reach(self, sigma):
+        """Reach probability of every node split by contributor: one column per player, last for chance"""
+        weights = self._edge_weights(sigma)
+        reach = np.ones((len(self.kind), self.num_players + 1))
+        for _, edges, _ in self.levels:
+            rows = reach[self.edge_parent[edges]]
+            rows[np.arange(len(edges)), self.edge_actor[edges]] *= weights[edges]
+            reach[self.child[edges]] = rows
+        return reach
+
+    def _values(self, sigma):
+        """Expected payoff vector of every node's subgame when everyone plays sigma"""
+        weights = self._edge_weights(sigma)
+        values = np.where(np.isnan(self.payoffs), 0.0, self.payoffs)
+        for nodes, edges, starts in reversed(self.levels):
+            contributions = weights[edges, np.newaxis] * values[self.child[edges]]
+            values[nodes] = np.add.reduceat(contributions, starts)
+        return values
+
+    def expected_payoffs(self, strategy=None):
+        strategy = self.average_strategy() if strategy is None else strategy
+        return self._values(strategy)[self.root]
+
+    def _sampled_iterations(self, method, iterations, processes, batch, epsilon, seed):
+        seeds = np.random.SeedSequence(seed)
+        state = self._sampling_state()
+        workers = 1 if processes == 1 else processes or os.cpu_count() or 1
+        if workers == 1:
+            # In-process sampling updates the live tables after every sample
+            _init_worker(state)
+            _run_samples(method, self.regrets, self.regrets, self.strategy_sum, iterations,
+                         np.random.default_rng(seeds), epsilon)
+            self.iterations += iterations
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        remaining = iterations
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+            while remaining > 0:
+                # One round: every worker samples against the same snapshot of the regret table
+                sizes = [min(batch, remaining - k * batch) for k in range(workers) if remaining > k * batch]
+                tasks = [(method, self.regrets, size, epsilon, child_seed)
+                         for size, child_seed in zip(sizes, seeds.spawn(len(sizes)))]
+                for regret_delta, strategy_delta in pool.map(_sample_task, tasks):
+                    self.regrets += regret_delta
+                    self.strategy_sum += strategy_delta
+                remaining -= sum(sizes)
+                self.iterations += sum(sizes)
+
+    def _sampling_state(self):
+        """Plain-list copy of the tree for the per-node loops of the sampling variants"""
+        return {
+            'kind': self.kind.tolist(), 'player': self.player.tolist(),
+            'child_start': self.child_start.tolist(), 'child': self.child.tolist(),
+            'probability': self.probability.tolist(), 'payoffs': self.payoffs.tolist(),
+            'node_infoset': self.node_infoset.tolist(), 'infoset_start': self.infoset_start.tolist(),
+            'num_players': self.num_players, 'root': self.root, 'num_slots': self.num_slots
+        }
+
+    def best_response_value(self, player, strategy=None):
+        """Value the player gets by best responding to everyone else playing `strategy`
+
+        Information sets of the player are decided from the deepest up (by
+        their shallowest node, which under perfect recall puts every later
+        information set of that player first), and subtree values are cached,
+        so each node is evaluated once.
+        """
+        strategy = self.average_strategy() if strategy is None else strategy
+        reach = self._reach(strategy)
+        others = np.prod(np.delete(reach, player, axis=1), axis=1).tolist()
+        kinds, players = self.kind.tolist(), self.player.tolist()
+        starts, child = self.child_start.tolist(), self.child.tolist()
+        weights = self._edge_weights(strategy).tolist()
+        node_infoset = self.node_infoset.tolist()
+        payoffs = self.payoffs[:, player].tolist()
+        value = [None] * len(kinds)
+        best = {}
+
+        def evaluate(node):
+            stack = [node]
+            while stack:
+                h = stack[-1]
+                if value[h] is not None:
+                    stack.pop()
+                    continue
+                if kinds[h] == TERMINAL:
+                    value[h] = payoffs[h]
+                    stack.pop()
+                    continue
+                if kinds[h] == DECISION and players[h] == player:
+                    kids = [child[starts[h] + best[node_infoset[h]]]]
+                else:
+                    kids = child[starts[h]:starts[h + 1]]
+                missing = [c for c in kids if value[c] is None]
+                if missing:
+                    stack.extend(missing)
+                    continue
+                stack.pop()
+                if kinds[h] == DECISION and players[h] == player:
+                    value[h] = value[kids[0]]
+                else:
+                    value[h] = sum(weights[e] * value[child[e]] for e in range(starts[h], starts[h + 1]))
+            return value[node]
+
+        mine = np.flatnonzero((self.kind == DECISION) & (self.player == player))
+        infosets = self.node_infoset[mine]
+        shallowest = np.full(len(self.num_actions), np.iinfo(np.int64).max)
+        np.minimum.at(shallowest, infosets, self.depth[mine])
+        members = {}
+        for node, infoset in zip(mine.tolist(), infosets.tolist()):
+            members.setdefault(infoset, []).append(node)
+        for infoset in sorted(members, key=lambda i: -shallowest[i]):
+            totals = [0.0] * int(self.num_actions[infoset])
+            for h in members[infoset]:
+                if others[h] == 0:
+                    continue
+                for a in range(len(totals)):
+                    totals[a] += others[h] * evaluate(child[starts[h] + a])
+            best[infoset] = max(range(len(totals)), key=totals.__getitem__)
+        return evaluate(self.root)
+
+    def nash_conv(self, strategy=None):
+        """Sum over players of the gain from best responding; zero exactly at a Nash equilibrium"""
+        strategy = self.average_strategy() if strategy is None else strategy
+        values = self.expected_payoffs(strategy)
+        return float(sum(self.best_response_value(p, strategy) - values[p] for p in range(self.num_players)))
+
+    def policy(self, strategy=None):
+        """{(player, information set key): {action label: probability}} for a slot-array strategy
+
+        Information sets added without a key are named by their first node.
+        Without a GameTree (solver built from arrays) keys are compact infoset ids.
+        """
+        strategy = self.average_strategy() if strategy is None else strategy
+        decision = np.flatnonzero(self.kind == DECISION)
+        first = {}
+        for node, infoset in zip(decision.tolist(), self.node_infoset[decision].tolist()):
+            first.setdefault(infoset, node)
+
+        result = {}
+        for infoset, node in first.items():
+            probs = strategy[self.infoset_start[infoset]:self.infoset_start[infoset + 1]].tolist()
+            if self.tree is None:
+                result[infoset] = probs
+            else:
+                result[self.tree.infoset_key(node)] = dict(zip(self.tree.actions(node), probs))
+        return result
+
+    def strategy_from_policy(self, policy):
+        """Slot-array strategy for a policy() style dict, e.g. to score another solver's policy"""
+        if self.tree is None:
+            raise ValueError("Policies are keyed by the GameTree; this solver was built from arrays")
+        strategy = np.zeros(self.num_slots)
+        decision = np.flatnonzero(self.kind == DECISION)
+        for node, infoset in zip(decision.tolist(), self.node_infoset[decision].tolist()):
+            probs = policy[self.tree.infoset_key(node)]
+            start, end = self.infoset_start[infoset], self.infoset_start[infoset + 1]
+            strategy[start:end] = [probs[action] for action in self.tree.actions(node)]
+        return strategy
+
+
+# State of the tree inside each worker process, installed once by the pool initializer
+_STATE = None
+
+
+def _init_worker(state):
+    global _STATE
+    _STATE = state
+
+
+def _regret_matching(regrets):
+    positive = [r if r > 0 else 0.0 for r in regrets]
+    total = sum(positive)
+    if total > 0:
+        return [r / total for r in positive]
+    return [1.0 / len(regrets)] * len(regrets)
+
+
+def _sample_task(task):
+    """Run sampled traversals against a regret snapshot in a worker; return the increments"""
+    method, regrets, samples, epsilon, seed = task
+    regret_delta = np.zeros(_STATE['num_slots'])
+    strategy_delta = np.zeros(_STATE['num_slots'])
+    _run_samples(method, regrets, regret_delta, strategy_delta, samples, np.random.default_rng(seed), epsilon)
+    return regret_delta, strategy_delta
+
+
+def _run_samples(method, regrets, regret_delta, strategy_delta, samples, rng, epsilon):
+    """`samples` traversals per player, reading regrets and adding into the delta arrays"""
+    traverse = _outcome_sample if method == 'outcome_sampling' else _external_sample
+    for _ in range(samples):
+        for traverser in range(_STATE['num_players']):
+            traverse(traverser, regrets, regret_delta, strategy_delta, rng, epsilon)
+
+
+def _choose(probs, rng):
+    u = rng.random()
+    total = 0.0
+    for a, p in enumerate(probs):
+        total += p
+        if u < total:
+            return a
+    return len(probs) - 1
+
+
+def _outcome_sample(traverser, regrets, regret_delta, strategy_delta, rng, epsilon):
+    """Outcome-sampling MCCFR: one trajectory with epsilon exploration at the traverser's nodes"""
+    s = _STATE
+    kinds, players, starts, child = s['kind'], s['player'], s['child_start'], s['child']
+    node, path = s['root'], []
+    own_reach = other_reach = sample_reach = 1.0
+    while kinds[node] != TERMINAL:
+        first = starts[node]
+        k = starts[node + 1] - first
+        if kinds[node] == CHANCE:
+            probs = s['probability'][first:first + k]
+            a = _choose(probs, rng)
+            other_reach *= probs[a]
+            sample_reach *= probs[a]
+        else:
+            base = s['infoset_start'][s['node_infoset'][node]]
+            sigma = _regret_matching(regrets[base:base + k].tolist())
+            if players[node] == traverser:
+                explore = [epsilon / k + (1 - epsilon) * p for p in sigma]
+                a = _choose(explore, rng)
+                path.append((base, k, a, sigma, own_reach, other_reach, sample_reach))
+                own_reach *= sigma[a]
+                sample_reach *= explore[a]
+            else:
+                a = _choose(sigma, rng)
+                other_reach *= sigma[a]
+                sample_reach *= sigma[a]
+        node = child[first + a]
+
+    utility = s['payoffs'][node][traverser] / sample_reach
+    tail = 1.0  # traverser's own reach from below the current node to the terminal
+    for base, k, a, sigma, own, other, reach in reversed(path):
+        weight = utility * other * tail
+        for b in range(k):
+            regret_delta[base + b] += weight * ((b == a) - sigma[a])
+            strategy_delta[base + b] += own / reach * sigma[b]
+        tail *= sigma[a]
+
+
+def _external_sample(traverser, regrets, regret_delta, strategy_delta, rng, epsilon):
+    """External-sampling MCCFR: all traverser actions, one sampled action elsewhere"""
+    s = _STATE
+    kinds, players, starts, child = s['kind'], s['player'], s['child_start'], s['child']
+    order, stack, sampled = [], [s['root']], {}
+    # Walk down, fixing one child at chance and opponent nodes
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if kinds[node] == TERMINAL:
+            continue
+        first = starts[node]
+        k = starts[node + 1] - first
+        if kinds[node] == CHANCE:
+            sampled[node] = _choose(s['probability'][first:first + k], rng)
+        elif players[node] == traverser:
+            stack.extend(child[first:first + k])
+            continue
+        else:
+            base = s['infoset_start'][s['node_infoset'][node]]
+            sigma = _regret_matching(regrets[base:base + k].tolist())
+            for b in range(k):
+                strategy_delta[base + b] += sigma[b]
+            sampled[node] = _choose(sigma, rng)
+        stack.append(child[first + sampled[node]])
+
+    # Children were pushed after their parents, so the reversed walk is bottom-up
+    value = {}
+    for node in reversed(order):
+        if kinds[node] == TERMINAL:
+            value[node] = s['payoffs'][node][traverser]
+        elif node in sampled:
+            value[node] = value[child[starts[node] + sampled[node]]]
+        else:
+            first = starts[node]
+            k = starts[node + 1] - first
+            base = s['infoset_start'][s['node_infoset'][node]]
+            sigma = _regret_matching(regrets[base:base + k].tolist())
+            action_values = [value[c] for c in child[first:first + k]]
+            total = sum(p * v for p, v in zip(sigma, action_values))
+            for b in range(k):
+                regret_delta[base + b] += action_values[b] - total
+            value[node] = total
@@ -0,0 +1,120 @@
+import numpy as np
+from payoff_tensor import PayoffTensor
+
+
+class CorrelatedEquilibrium:
+    """Correlated (CE) and coarse correlated (CCE) equilibria of N-player games
+
+    The unknown is a distribution mu over pure profiles. Each incentive
+    constraint is one sparse row, built for all strategy pairs of a player at
+    once from the payoff tensor, so the problem stays polynomial in the size
+    of the payoff table.
+    """
+
+    OBJECTIVES = ('welfare', 'max_min', 'max_entropy')
+    TOL = 1e-9
+
+    @staticmethod
+    def incentive_constraints(game, coarse=False):
+        """Sparse matrix G with G @ mu <= 0 exactly when mu is a CE (or a CCE with coarse=True)
+
+        CE rows are (player, recommended s, deviation t): the gain from playing
+        t whenever s is recommended. CCE rows are (player, t): the gain from
+        ignoring the recommendation and always playing t.
+        """
+        from scipy.sparse import coo_matrix
+
+        game = PayoffTensor.from_game(game)
+        shape = game.shape
+        profiles = np.arange(int(np.prod(shape))).reshape(shape)
+        rows, cols, data = [], [], []
+        offset = 0
+        for player, n in enumerate(shape):
+            # Player's own strategy first, every opponent profile flattened behind it
+            U = np.moveaxis(game.player_payoffs(player), player, 0).reshape(n, -1)
+            index = np.moveaxis(profiles, player, 0).reshape(n, -1)
+            if coarse:
+                gains = U[:, np.newaxis, :] - U[np.newaxis, :, :]  # (t, s, opponents)
+                rows.append(np.repeat(offset + np.arange(n), U.size))
+                cols.append(np.tile(index.ravel(), n))
+                data.append(gains.ravel())
+                offset += n
+            else:
+                s, t = np.nonzero(~np.eye(n, dtype=bool))
+                gains = U[t] - U[s]  # (pairs, opponents)
+                rows.append(np.repeat(offset + np.arange(len(s)), U.shape[1]))
+                cols.append(index[s].ravel())
+                data.append(gains.ravel())
+                offset += len(s)
+
+        rows, cols, data = np.concatenate(rows), np.concatenate(cols), np.concatenate(data)
+        keep = data != 0
+        return coo_matrix((data[keep], (rows[keep], cols[keep])), shape=(offset, profiles.size)).tocsr()
+
+    @staticmethod
+    def solve(game, objective='welfare', coarse=False):
+        """Correlated equilibrium optimising `objective`
+
+        'welfare' maximises total expected payoff and 'max_min' the lowest
+        player's expected payoff, each with one HiGHS LP. 'max_entropy' finds
+        the most uniform equilibrium by minimising its convex dual with
+        L-BFGS-B. Returns the 'distribution' as {profile: probability} over the
+        support, the players' 'expected_payoffs' and the 'welfare'.
+        """
+        from scipy.optimize import linprog, minimize
+        from scipy.sparse import csr_matrix, hstack, vstack
+
+        if objective not in CorrelatedEquilibrium.OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}', expected one of {CorrelatedEquilibrium.OBJECTIVES}")
+        game = PayoffTensor.from_game(game)
+        G = CorrelatedEquilibrium.incentive_constraints(game, coarse=coarse)
+        num_profiles = G.shape[1]
+        payoffs = game.payoffs.reshape(num_profiles, game.num_players)
+
+        if objective == 'max_entropy':
+            # Dual of max H(mu) s.t. G mu <= 0, sum mu = 1: mu is a softmax of -G^T lam, lam >= 0
+            scale = max(1.0, np.abs(G.data).max()) if G.nnz else 1.0
+            G = G / scale
+            GT = G.T.tocsr()
+
+            def dual(lam):
+                logits = -(GT @ lam)
+                top = logits.max()
+                weights = np.exp(logits - top)
+                total = weights.sum()
+                return top + np.log(total), -(G @ (weights / total))
+
+            res = minimize(dual, np.zeros(G.shape[0]), jac=True, method='L-BFGS-B',
+                           bounds=[(0, None)] * G.shape[0],
+                           options={'ftol': 1e-15, 'gtol': 1e-10, 'maxiter': 10000})
+            logits = -(GT @ res.x)
+            mu = np.exp(logits - logits.max())
+            mu /= mu.sum()
+        else:
+            # Variables: mu, plus the guaranteed payoff z for 'max_min'
+            extra = 1 if objective == 'max_min' else 0
+            A_ub = hstack([G, csr_matrix((G.shape[0], extra))]).tocsr()
+            b_ub = np.zeros(G.shape[0])
+            if objective == 'welfare':
+                c = -payoffs.sum(axis=1)
+            else:
+                c = np.concatenate([np.zeros(num_profiles), [-1.0]])
+                # z <= expected payoff of each player
+                guarantee = hstack([csr_matrix(-payoffs.T), csr_matrix(np.ones((game.num_players, 1)))])
+                A_ub = vstack([A_ub, guarantee]).tocsr()
+                b_ub = np.concatenate([b_ub, np.zeros(game.num_players)])
+            A_eq = csr_matrix(np.concatenate([np.ones(num_profiles), np.zeros(extra)])[np.newaxis])
+            bounds = [(0, None)] * num_profiles + [(None, None)] * extra
+            res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[1.0], bounds=bounds, method='highs')
+            if not res.success:
+                raise ValueError(f"Correlated equilibrium LP failed: {res.message}")
+            mu = np.maximum(res.x[:num_profiles], 0)
+            mu /= mu.sum()
+
+        expected = payoffs.T @ mu
+        support = np.flatnonzero(mu > CorrelatedEquilibrium.TOL)
+        return {
+            'distribution': {game.profile_names(np.unravel_index(i, game.shape)): float(mu[i]) for i in support},
+            'expected_payoffs': tuple(expected.tolist()),
+            'welfare': float(expected.sum())
+        }
@@ -1,56 +1,89 @@
-class CustomGame:
-    def __init__(self, players, strategies, payoff_matrix):
+from collections.abc import Mapping
+from itertools import product
+from math import prod
+import numpy as np
+from game import Game
+from payoff_tensor import PayoffTensor
+
+
+class DefaultPayoffs(Mapping):
+    """Read-only view of a sparse payoff table: every profile not in the table pays the default"""
+
+    def __init__(self, table, strategies, default):
+        self.table = table
+        self.strategies = strategies
+        self.default = default
+        self._valid = [set(strats) for strats in strategies]
+
+    def __getitem__(self, profile):
+        if profile in self.table:
+            return self.table[profile]
+        if len(profile) == len(self._valid) and all(s in valid for s, valid in zip(profile, self._valid)):
+            return self.default
+        raise KeyError(profile)
+
+    def __iter__(self):
+        return product(*self.strategies)
+
+    def __len__(self):
+        return prod(len(strats) for strats in self.strategies)
+
+
+class CustomGame(Game):
+    def __init__(self, players, strategies, payoff_matrix, default_payoff=None):
         self.players = players
         self.strategies = strategies
         self.payoff_matrix = payoff_matrix
+        # With a default payoff, payoff_matrix only needs the profiles that differ from it
+        self.default_payoff = default_payoff
     
     def set_payoff(self, strategy_profile, payoffs):
         self.payoff_matrix[strategy_profile] = payoffs
+        self.invalidate()
     
-    def find_nash_equilibrium(self):
-        from game_analyzer import GameAnalyzer
-        
-        best_responses = {}
-        num_players = len(self.players)
-        
-        for player in range(num_players):
-            best_responses[player] = {}
-            opponent_indices = [i for i in range(num_players) if i != player]
-            
-            for opp_strategies in self._get_opponent_strategies(player):
-                max_payoff = -float('inf')
-                best_strategy = None
-                
-                for strategy in self.strategies[player]:
-                    strategy_profile = list(opp_strategies)
-                    strategy_profile.insert(player, strategy)
-                    payoff = self.payoff_matrix[tuple(strategy_profile)][player]
-                    
-                    if payoff > max_payoff:
-                        max_payoff = payoff
-                        best_strategy = strategy
-                
-                best_responses[player][opp_strategies] = best_strategy
-        
-        # Find Nash equilibria
-        nash_eq = []
-        for strategy_profile in self._generate_all_profiles():
-            is_nash = True
-            for player in range(num_players):
-                opp_strategies = tuple(s for i, s in enumerate(strategy_profile) if i != player)
-                if strategy_profile[player] != best_responses[player][opp_strategies]:
-                    is_nash = False
-                    break
-            if is_nash:
-                nash_eq.append(strategy_profile)
+    def payoff_table(self):
+        """The payoff dict, or with a default payoff a lazy view that never lists the default profiles"""
+        if self.default_payoff is None:
+            return self.payoff_matrix
+        return DefaultPayoffs(self.payoff_matrix, self.strategy_lists(), self._default())
+    
+    def _default(self):
+        default = self.default_payoff
+        return tuple(default) if isinstance(default, (tuple, list)) else (default,) * len(self.strategies)
+    
+    def _build_tensor(self):
+        if self.default_payoff is None:
+            return super()._build_tensor()
+        # Start from the default everywhere and scatter only the table entries
+        strategies = self.strategy_lists()
+        tensor = PayoffTensor(strategies, np.broadcast_to(
+            np.asarray(self._default(), dtype=float), tuple(map(len, strategies)) + (len(strategies),)).copy())
+        for profile, payoffs in self.payoff_matrix.items():
+            tensor.payoffs[tensor.profile_index(profile)] = payoffs
+        return tensor
+    
+    def find_nash_equilibrium(self, limit=None):
+        """List of pure equilibria, at most limit of them
+
+        With a default payoff the list can be huge; pass a limit or use
+        equilibrium_region() for a compact description of all of them.
+        """
+        from best_response import BestResponseOracle
         
-        return nash_eq
+        if self.default_payoff is not None:
+            return list(self.to_sparse().iter_pure_equilibria(limit=limit))
+        equilibria = BestResponseOracle.for_game(self.tensor()).pure_equilibria()
+        return equilibria if limit is None else equilibria[:limit]
     
-    def _get_opponent_strategies(self, player):
-        from itertools import product
-        other_players = [i for i in range(len(self.players)) if i != player]
-        other_strategies = [self.strategies[i] for i in other_players]
-        return product(*other_strategies)
+    def equilibrium_region(self):
+        """All pure equilibria as a ProfileRegion, without listing the default profiles"""
+        return self.to_sparse().pure_equilibria()
+    
+    def to_sparse(self):
+        """Lazily evaluated view of this game that never builds the full profile table"""
+        from sparse_game import SparseGame
+        default = self.default_payoff if self.default_payoff is not None else 0
+        return SparseGame(self.players, self.strategies, table=self.payoff_matrix, default=default)
     
     def _generate_all_profiles(self):
         from itertools import product
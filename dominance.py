@@ -0,0 +1,164 @@
+import numpy as np
+from payoff_tensor import PayoffTensor
+
+
+class Dominance:
+    """Dominance tests and iterated elimination of dominated strategies on a PayoffTensor"""
+
+    TOL = 1e-9
+
+    @staticmethod
+    def is_dominated(game, player, strategy, weak=False, mixed=False):
+        """Check whether a strategy is dominated by a pure (or, with mixed=True, mixed) strategy"""
+        alive = [np.arange(n) for n in game.shape]
+        matrix = Dominance._player_matrix(game, player, alive)
+        row = game.index[player][strategy]
+        if Dominance._pure_dominator(matrix, row, weak) is not None:
+            return True
+        if not (mixed and Dominance._never_best(matrix, weak)[row]):
+            return False
+        return Dominance._mixed_dominator(matrix, row, weak) is not None
+
+    @staticmethod
+    def iterated_elimination(game, weak=False, mixed=True):
+        """Repeatedly remove dominated strategies of every player
+
+        Works on per-player arrays of surviving indices into the original tensor, so
+        nothing is copied until the reduced game is built at the end. Returns the
+        reduced PayoffTensor and a trace of eliminations in the order they happened.
+        """
+        alive = [np.arange(n) for n in game.shape]
+        trace = []
+
+        # Cheap pure-dominance sweeps run to a fixpoint before each round of LPs
+        while True:
+            while Dominance._sweep(game, alive, trace, weak, use_lp=False):
+                pass
+            if not (mixed and Dominance._sweep(game, alive, trace, weak, use_lp=True)):
+                break
+
+        reduced = PayoffTensor(
+            [[strats[i] for i in idx] for strats, idx in zip(game.strategies, alive)],
+            game.payoffs[np.ix_(*alive)]
+        )
+        return reduced, trace
+
+    @staticmethod
+    def _sweep(game, alive, trace, weak, use_lp):
+        """One elimination pass over every player, returns whether anything was removed"""
+        changed = False
+        for player in range(game.num_players):
+            if len(alive[player]) < 2:
+                continue
+            matrix = Dominance._player_matrix(game, player, alive)
+
+            # A row that is the best reply to some opponent profile cannot be
+            # dominated by any mixture, so only the rest need an LP
+            lp_candidates = Dominance._never_best(matrix, weak) if use_lp else None
+
+            removed, entries = [], []
+            for row in range(len(alive[player])):
+                dominator = Dominance._pure_dominator(matrix, row, weak)
+                if dominator is not None:
+                    dominated_by = game.strategies[player][alive[player][dominator]]
+                elif use_lp and lp_candidates[row]:
+                    weights = Dominance._mixed_dominator(matrix, row, weak)
+                    if weights is None:
+                        continue
+                    dominated_by = {
+                        game.strategies[player][alive[player][k]]: float(w)
+                        for k, w in enumerate(weights) if w > Dominance.TOL
+                    }
+                else:
+                    continue
+
+                removed.append(row)
+                entries.append({
+                    'player': player,
+                    'strategy': game.strategies[player][alive[player][row]],
+                    'dominated_by': dominated_by,
+                    'kind': 'weak' if weak else 'strict'
+                })
+
+            # Guard against numerical ties emptying a player's strategy set; the
+            # trace only records eliminations that are actually applied
+            if removed and len(removed) < len(alive[player]):
+                alive[player] = np.delete(alive[player], removed)
+                trace.extend(entries)
+                changed = True
+        return changed
+
+    @staticmethod
+    def _player_matrix(game, player, alive):
+        """Player's payoffs restricted to surviving strategies: rows are own strategies, columns opponent profiles"""
+        payoffs = game.player_payoffs(player)
+        for axis, idx in enumerate(alive):
+            if len(idx) < payoffs.shape[axis]:
+                payoffs = np.take(payoffs, idx, axis=axis)
+        payoffs = np.moveaxis(payoffs, player, 0)
+        return payoffs.reshape(payoffs.shape[0], -1)
+
+    @staticmethod
+    def _never_best(matrix, weak):
+        """Rows that are never a (unique, when weak) column maximum"""
+        if len(matrix) < 2:
+            return np.zeros(len(matrix), dtype=bool)
+        top_two = -np.partition(-matrix, 1, axis=0)[:2]
+        # Best payoff among the other rows, per column
+        best_other = np.where(matrix >= top_two[0], top_two[1], top_two[0])
+        if weak:
+            return ~np.any(matrix > best_other, axis=1)
+        return ~np.any(matrix >= best_other, axis=1)
+
+    @staticmethod
+    def _pure_dominator(matrix, row, weak):
+        """Index of a pure strategy dominating the given row, or None"""
+        if weak:
+            better = np.all(matrix >= matrix[row], axis=1) & np.any(matrix > matrix[row], axis=1)
+        else:
+            better = np.all(matrix > matrix[row], axis=1)
+        better[row] = False
+        hits = np.flatnonzero(better)
+        return int(hits[0]) if len(hits) else None
+
+    @staticmethod
+    def _mixed_dominator(matrix, row, weak):
+        """Weights of a mixed strategy over the other rows dominating the given row, or None
+
+        Strict: maximize e subject to sigma @ M[others] >= M[row] + e.
+        Weak: maximize the total slack subject to sigma @ M[others] >= M[row].
+        """
+        from scipy.optimize import linprog
+
+        others = np.delete(np.arange(len(matrix)), row)
+        if len(others) < 2:
+            return None
+        M = matrix[others]
+        k, columns = M.shape
+
+        if weak:
+            c = -M.sum(axis=1)
+            A_ub = -M.T
+            A_eq = np.ones((1, k))
+            bounds = [(0, None)] * k
+        else:
+            c = np.zeros(k + 1)
+            c[-1] = -1
+            A_ub = np.hstack([-M.T, np.ones((columns, 1))])
+            A_eq = np.append(np.ones(k), 0)[np.newaxis]
+            bounds = [(0, None)] * k + [(None, None)]
+
+        res = linprog(c, A_ub=A_ub, b_ub=-matrix[row], A_eq=A_eq, b_eq=[1], bounds=bounds, method='highs')
+        if not res.success:
+            return None
+
+        if weak:
+            gain = -res.fun - matrix[row].sum()
+        else:
+            gain = res.x[-1]
+        if gain <= Dominance.TOL:
+            return None
+
+        weights = np.zeros(len(matrix))
+        weights[others] = res.x[:k]
+        return weights
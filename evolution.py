@@ -0,0 +1,138 @@
+import numpy as np
+from payoff_tensor import PayoffTensor
+
+
+class EvolutionaryDynamics:
+    """Replicator, best-response and logit dynamics for one (symmetric) or two (asymmetric) populations
+
+    Every method works on a batch of populations at once: states have shape (P, n),
+    one row per initial condition.
+    """
+
+    DYNAMICS = ('replicator', 'best_response', 'logit')
+
+    def __init__(self, A, B=None, dynamics='replicator', temperature=0.1):
+        if dynamics not in self.DYNAMICS:
+            raise ValueError(f"Unknown dynamics '{dynamics}', expected one of {self.DYNAMICS}")
+        self.A = np.asarray(A, dtype=float)
+        self.B = None if B is None else np.asarray(B, dtype=float)
+        self.dynamics = dynamics
+        self.temperature = temperature
+        self.strategies = None
+
+    @classmethod
+    def from_game(cls, game, symmetric=None, **kwargs):
+        """Build dynamics from a bundled game object, a payoff dict or a 2-player PayoffTensor
+
+        Symmetric games (same strategies, B == A.T) use a single population unless
+        symmetric=False is given.
+        """
+        game = PayoffTensor.from_game(game)
+        if game.num_players != 2:
+            raise ValueError("Evolutionary dynamics need a 2-player game")
+
+        A, B = game.payoffs[..., 0], game.payoffs[..., 1]
+        is_symmetric = game.strategies[0] == game.strategies[1] and np.array_equal(A, B.T)
+        if symmetric is None:
+            symmetric = is_symmetric
+        elif symmetric and not is_symmetric:
+            raise ValueError("Game is not symmetric")
+
+        dynamics = cls(A, None if symmetric else B, **kwargs)
+        dynamics.strategies = game.strategies
+        return dynamics
+
+    @property
+    def symmetric(self):
+        return self.B is None
+
+    def velocity(self, state):
+        """Time derivative of a batch of (concatenated) population states"""
+        if self.symmetric:
+            return self._field(state, state @ self.A.T)
+        n = self.A.shape[0]
+        x, y = state[:, :n], state[:, n:]
+        return np.hstack([self._field(x, y @ self.A.T), self._field(y, x @ self.B)])
+
+    def _field(self, x, fitness):
+        if self.dynamics == 'replicator':
+            mean = np.sum(x * fitness, axis=1, keepdims=True)
+            return x * (fitness - mean)
+        if self.dynamics == 'best_response':
+            best = fitness >= fitness.max(axis=1, keepdims=True)
+            return best / best.sum(axis=1, keepdims=True) - x
+        # Logit: smoothed best response at the given temperature
+        scaled = (fitness - fitness.max(axis=1, keepdims=True)) / self.temperature
+        weights = np.exp(scaled)
+        return weights / weights.sum(axis=1, keepdims=True) - x
+
+    def run(self, x0, steps, dt=0.01, y0=None, method='rk4', record_every=1,
+            trajectory_path=None, chunk_size=1000):
+        """Integrate a batch of initial populations
+
+        x0 (and y0 for asymmetric games) has shape (P, n) or (n,). Returns the final
+        state and the recorded trajectory of shape (records, P, n [+ m]). With
+        trajectory_path the trajectory is written to a .npy file in chunks of
+        chunk_size records and returned as a read-only memmap.
+        """
+        state = np.atleast_2d(np.asarray(x0, dtype=float))
+        if not self.symmetric:
+            if y0 is None:
+                raise ValueError("Asymmetric games need initial states for both populations")
+            state = np.hstack([state, np.atleast_2d(np.asarray(y0, dtype=float))])
+        state = state.copy()
+        if method not in ('rk4', 'euler'):
+            raise ValueError(f"Unknown integration method '{method}'")
+
+        records = steps // record_every + 1
+        if trajectory_path is None:
+            trajectory = np.empty((records,) + state.shape)
+            buffer = trajectory
+        else:
+            trajectory = np.lib.format.open_memmap(trajectory_path, mode='w+', shape=(records,) + state.shape)
+            buffer = np.empty((min(chunk_size, records),) + state.shape)
+
+        filled, written = 0, 0
+
+        def record():
+            nonlocal filled, written
+            buffer[filled] = state
+            filled += 1
+            # A full buffer is flushed right away, including after the initial record
+            if buffer is not trajectory and filled == len(buffer):
+                trajectory[written:written + filled] = buffer
+                written, filled = written + filled, 0
+
+        record()
+        for step in range(1, steps + 1):
+            if method == 'euler':
+                state += dt * self.velocity(state)
+            else:
+                k1 = self.velocity(state)
+                k2 = self.velocity(state + 0.5 * dt * k1)
+                k3 = self.velocity(state + 0.5 * dt * k2)
+                k4 = self.velocity(state + dt * k3)
+                state += dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+            if step % record_every == 0:
+                # All three fields conserve total mass, so round-off is only
+                # cleaned up when a record is taken
+                self._project(state)
+                record()
+
+        if buffer is not trajectory:
+            trajectory[written:written + filled] = buffer[:filled]
+            trajectory.flush()
+            trajectory = np.load(trajectory_path, mmap_mode='r')
+        self._project(state)
+        return state, trajectory
+
+    def _project(self, state):
+        """Clip round-off and renormalize each population back onto its simplex"""
+        np.clip(state, 0, None, out=state)
+        if self.symmetric:
+            state /= state.sum(axis=1, keepdims=True)
+        else:
+            n = self.A.shape[0]
+            state[:, :n] /= state[:, :n].sum(axis=1, keepdims=True)
+            state[:, n:] /= state[:, n:].sum(axis=1, keepdims=True)
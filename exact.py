@@ -0,0 +1,168 @@
+import numpy as np
+from fractions import Fraction
+from itertools import combinations
+from math import lcm
+
+
+class ExactSolver:
+    """Certified equilibria of 2-player games in rational arithmetic
+
+    Payoffs are converted to Fractions and each player's matrix is scaled by the
+    common denominator to plain integers (equilibria do not change under a positive
+    rescaling). Linear systems are then solved with fraction-free Bareiss
+    elimination, so no gcd is taken until the final division.
+    """
+
+    @staticmethod
+    def to_fraction(value):
+        """Exact rational for a payoff; floats are read by their shortest decimal repr (0.4 -> 2/5)"""
+        if isinstance(value, float):
+            return Fraction(repr(value))
+        if isinstance(value, np.floating):
+            return Fraction(repr(float(value)))
+        return Fraction(value)
+
+    @staticmethod
+    def to_integer_matrix(M):
+        """Scale a matrix of rationals by its common denominator, returning a list of int rows"""
+        rows = [[ExactSolver.to_fraction(v) for v in row] for row in M]
+        denominator = lcm(*(v.denominator for row in rows for v in row))
+        return [[int(v * denominator) for v in row] for row in rows]
+
+    @staticmethod
+    def bareiss_solve(M, b):
+        """Solve M z = b for an integer matrix; returns a list of Fractions, or None if singular"""
+        n = len(M)
+        rows = [list(M[i]) + [b[i]] for i in range(n)]
+        previous = 1
+        for k in range(n):
+            pivot = next((i for i in range(k, n) if rows[i][k] != 0), None)
+            if pivot is None:
+                return None
+            rows[k], rows[pivot] = rows[pivot], rows[k]
+            for i in range(k + 1, n):
+                for j in range(k + 1, n + 1):
+                    # Exact division: Bareiss guarantees `previous` divides the 2x2 minor
+                    rows[i][j] = (rows[i][j] * rows[k][k] - rows[i][k] * rows[k][j]) // previous
+                rows[i][k] = 0
+            previous = rows[k][k]
+
+        # Back substitution on the fraction-free upper-triangular system
+        solution = [Fraction(0)] * n
+        for i in reversed(range(n)):
+            total = Fraction(rows[i][n]) - sum(rows[i][j] * solution[j] for j in range(i + 1, n))
+            solution[i] = total / rows[i][i]
+        return solution
+
+    @staticmethod
+    def solve_2x2(A, B):
+        """Closed-form indifference probabilities (p, q) as Fractions; None marks a degenerate player"""
+        A = [[ExactSolver.to_fraction(v) for v in row] for row in A]
+        B = [[ExactSolver.to_fraction(v) for v in row] for row in B]
+        a, b = A[0][0] - A[1][0], A[0][1] - A[1][1]
+        c, d = B[0][0] - B[0][1], B[1][0] - B[1][1]
+        p = d / (d - c) if c != d else None  # makes Player 2 indifferent
+        q = b / (b - a) if a != b else None  # makes Player 1 indifferent
+        return p, q
+
+    @staticmethod
+    def support_enumeration(A, B, max_support=None):
+        """Yield every equilibrium (x, y) of a nondegenerate game as lists of Fractions
+
+        Each support pair is screened in floating point first; only candidates
+        that survive are solved and verified exactly.
+        """
+        A = ExactSolver.to_integer_matrix(A)
+        B = ExactSolver.to_integer_matrix(B)
+        m, n = len(A), len(A[0])
+        A_float, B_float = np.array(A, dtype=float), np.array(B, dtype=float)
+        screen = 1e-7 * max(1.0, np.abs(A_float).max(), np.abs(B_float).max())
+
+        rows, cols = ExactSolver._undominated(A, B)
+        max_support = min(len(rows), len(cols), max_support or max(m, n))
+
+        for size in range(1, max_support + 1):
+            for I in combinations(rows, size):
+                for J in combinations(cols, size):
+                    if not ExactSolver._float_screen(A_float, B_float, list(I), list(J), screen):
+                        continue
+                    y = ExactSolver._indifferent(
+                        [[A[i][j] for j in J] for i in I])
+                    x = ExactSolver._indifferent(
+                        [[B[i][j] for i in I] for j in J])
+                    if x is None or y is None:
+                        continue
+
+                    full_x = [Fraction(0)] * m
+                    full_y = [Fraction(0)] * n
+                    for i, p in zip(I, x):
+                        full_x[i] = p
+                    for j, q in zip(J, y):
+                        full_y[j] = q
+                    if ExactSolver.exploitability(A, B, full_x, full_y) == 0:
+                        yield full_x, full_y
+
+    @staticmethod
+    def exploitability(A, B, x, y):
+        """Exact mean best-response gain of the two players against (x, y)"""
+        row_values = [sum(a * q for a, q in zip(row, y)) for row in A]
+        col_values = [sum(B[i][j] * x[i] for i in range(len(x))) for j in range(len(y))]
+        gain1 = max(row_values) - sum(p * v for p, v in zip(x, row_values))
+        gain2 = max(col_values) - sum(q * v for q, v in zip(y, col_values))
+        return Fraction(gain1 + gain2, 2)
+
+    @staticmethod
+    def _indifferent(M):
+        """Probabilities over M's columns making every row equally good, or None"""
+        size = len(M)
+        # Unknowns: one probability per column plus the common value v
+        system = [list(M[i]) + [-1] for i in range(size)] + [[1] * size + [0]]
+        rhs = [0] * size + [1]
+        solution = ExactSolver.bareiss_solve(system, rhs)
+        if solution is None:
+            return None
+        probs = solution[:size]
+        if any(p < 0 for p in probs):
+            return None
+        return probs
+
+    @staticmethod
+    def _float_screen(A, B, I, J, tol):
+        """Cheap floating-point rejection of support pairs that are clearly not equilibria"""
+        size = len(I)
+        try:
+            system = np.zeros((size + 1, size + 1))
+            system[:size, :size] = A[np.ix_(I, J)]
+            system[:size, size] = -1
+            system[size, :size] = 1
+            y = np.linalg.solve(system, np.eye(size + 1)[size])[:size]
+            system[:size, :size] = B[np.ix_(I, J)].T
+            x = np.linalg.solve(system, np.eye(size + 1)[size])[:size]
+        except np.linalg.LinAlgError:
+            # Near-singular systems are left for the exact solver to decide
+            return True
+        if x.min() < -tol or y.min() < -tol:
+            return False
+        full_x = np.zeros(A.shape[0])
+        full_x[I] = x
+        full_y = np.zeros(A.shape[1])
+        full_y[J] = y
+        row_values, col_values = A @ full_y, full_x @ B
+        return row_values.max() <= row_values[I].max() + tol and col_values.max() <= col_values[J].max() + tol
+
+    @staticmethod
+    def _undominated(A, B):
+        """Iteratively remove strictly dominated pure strategies with exact integer comparisons"""
+        rows, cols = list(range(len(A))), list(range(len(A[0])))
+        changed = True
+        while changed:
+            changed = False
+            keep = [i for i in rows
+                    if not any(all(A[k][j] > A[i][j] for j in cols) for k in rows if k != i)]
+            if len(keep) < len(rows):
+                rows, changed = keep, True
+            keep = [j for j in cols
+                    if not any(all(B[i][k] > B[i][j] for i in rows) for k in cols if k != j)]
+            if len(keep) < len(cols):
+                cols, changed = keep, True
+        return rows, cols
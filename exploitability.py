@@ -0,0 +1,51 @@
+import numpy as np
+from payoff_tensor import PayoffTensor
+
+
+class Exploitability:
+    """Distance of a mixed profile from equilibrium, measured by best-response gains
+
+    NashConv is the sum over players of what each could gain by switching to a
+    best response; exploitability is NashConv divided by the number of players.
+    Both are zero exactly at a Nash equilibrium.
+    """
+
+    @staticmethod
+    def best_response_gains(game, probs):
+        """Per-player gain from deviating to a best response against the profile"""
+        game = PayoffTensor.from_game(game)
+        probs = Exploitability._as_vectors(game, probs)
+        deviations = game.deviation_payoffs(probs)
+        gains = np.array([values.max() - values @ probs[player] for player, values in enumerate(deviations)])
+        # Gains are never negative; clip round-off at an exact equilibrium
+        return np.maximum(gains, 0)
+
+    @staticmethod
+    def nash_conv(game, probs):
+        return float(Exploitability.best_response_gains(game, probs).sum())
+
+    @staticmethod
+    def exploitability(game, probs):
+        gains = Exploitability.best_response_gains(game, probs)
+        return float(gains.sum() / len(gains))
+
+    @staticmethod
+    def best_response_gains_batch(game, probs):
+        """Gains for K profiles given as one (K, n_i) array per player, returns shape (K, num_players)"""
+        game = PayoffTensor.from_game(game)
+        probs = [np.asarray(batch, dtype=float) for batch in probs]
+        deviations = game.deviation_payoffs_batch(probs)
+        gains = np.stack([values.max(axis=1) - np.sum(values * probs[player], axis=1)
+                          for player, values in enumerate(deviations)], axis=1)
+        return np.maximum(gains, 0)
+
+    @staticmethod
+    def nash_conv_batch(game, probs):
+        return Exploitability.best_response_gains_batch(game, probs).sum(axis=1)
+
+    @staticmethod
+    def _as_vectors(game, probs):
+        """Accept probability arrays, {strategy: prob} dicts, or a {'Player 1': ...} profile"""
+        if isinstance(probs, dict):
+            probs = [probs.get(f'Player {player + 1}', probs.get(player)) for player in range(game.num_players)]
+        return [game.probability_vector(player, mixed) for player, mixed in enumerate(probs)]
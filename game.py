@@ -0,0 +1,53 @@
+from itertools import product
+from payoff_tensor import PayoffTensor
+
+
+class Game:
+    """Common protocol of the bundled normal-form games
+
+    A game lists its `players` and `strategies` (one shared list, or one list per
+    player) and returns its payoffs from payoff_table(). The normalised form,
+    a PayoffTensor with the strategy lists, index maps and content hash, is built
+    on first use and reused by every analyzer until invalidate() is called.
+    """
+
+    def payoff_table(self):
+        """{profile: payoffs} for every pure strategy profile"""
+        return self.payoffs
+
+    def strategy_lists(self):
+        """Ordered strategy list of each player"""
+        if self.strategies and isinstance(self.strategies[0], (list, tuple)):
+            return [list(strats) for strats in self.strategies]
+        return [list(self.strategies) for _ in self.players]
+
+    def tensor(self):
+        """The cached PayoffTensor of this game"""
+        if getattr(self, '_tensor', None) is None:
+            self._tensor = self._build_tensor()
+        return self._tensor
+
+    def _build_tensor(self):
+        return PayoffTensor.from_dict(self.payoff_table(), self.strategy_lists())
+
+    def invalidate(self):
+        """Forget the cached tensor after the payoffs change"""
+        self._tensor = None
+
+    @property
+    def num_players(self):
+        return self.tensor().num_players
+
+    @property
+    def index(self):
+        """Strategy name -> index map of each player"""
+        return self.tensor().index
+
+    def content_hash(self):
+        return self.tensor().content_hash()
+
+    def get_payoff(self, strategies):
+        return self.payoff_table()[tuple(strategies)]
+
+    def profiles(self):
+        return product(*self.strategy_lists())
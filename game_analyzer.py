@@ -1,10 +1,20 @@
 import numpy as np
-from itertools import product
+from payoff_tensor import PayoffTensor
+from bimatrix import BimatrixSolver
+from dominance import Dominance
+from best_response import BestResponseOracle
+from exploitability import Exploitability
+from exact import ExactSolver
+from correlated import CorrelatedEquilibrium
+from zero_sum import ZeroSumSolver
 
 class GameAnalyzer:
     @staticmethod
-    def find_pure_strategy_equilibria(payoff_matrix):
+    def find_pure_strategy_equilibria(payoff_matrix, vectorized=False):
         """Find all pure strategy Nash equilibria"""
+        if vectorized or not isinstance(payoff_matrix, dict):
+            return GameAnalyzer._pure_equilibria_tensor(PayoffTensor.from_game(payoff_matrix))
+
         players = range(len(next(iter(payoff_matrix.values()))))
         strategies = {
             player: list({s[player] for s in payoff_matrix.keys()})
@@ -41,171 +51,269 @@ class GameAnalyzer:
         return equilibria
 
     @staticmethod
-    def find_mixed_strategy_equilibrium(payoff_matrix, player1_strategies, player2_strategies):
-        """Calculate mixed strategy Nash equilibrium for 2-player games"""
-        # Convert payoff matrix to numpy arrays for easier calculation
-        p1_payoffs = np.zeros((len(player1_strategies), len(player2_strategies)))
-        p2_payoffs = np.zeros((len(player1_strategies), len(player2_strategies)))
+    def _pure_equilibria_tensor(game):
+        """Pure equilibria of a PayoffTensor via one best-response mask per player"""
+        is_equilibrium = np.ones(game.shape, dtype=bool)
         
-        # Fill payoff matrices
-        for i, s1 in enumerate(player1_strategies):
-            for j, s2 in enumerate(player2_strategies):
-                p1_payoffs[i,j], p2_payoffs[i,j] = payoff_matrix[(s1, s2)]
+        for player in range(game.num_players):
+            payoffs = game.player_payoffs(player)
+            # A profile survives if no unilateral deviation along this axis pays more
+            is_equilibrium &= payoffs >= payoffs.max(axis=player, keepdims=True)
         
-        # Solve for Player 2's probabilities that make Player 1 indifferent
-        if len(player1_strategies) == 2 and len(player2_strategies) == 2:
-            # For 2x2 games, we can solve directly
-            a, b = p1_payoffs[0,0] - p1_payoffs[1,0], p1_payoffs[0,1] - p1_payoffs[1,1]
-            if (a - b) != 0:
-                q = a / (a - b)  # Probability Player 2 plays first strategy
-            else:
-                q = 0.5  # If no unique solution, return 50-50
-            
-            c, d = p2_payoffs[0,0] - p2_payoffs[0,1], p2_payoffs[1,0] - p2_payoffs[1,1]
-            if (c - d) != 0:
-                p = d / (d - c)  # Probability Player 1 plays first strategy
+        return [game.profile_names(idx) for idx in zip(*np.nonzero(is_equilibrium))]
+
+    @staticmethod
+    def find_mixed_strategy_equilibrium(payoff_matrix, player1_strategies=None, player2_strategies=None,
+                                        method=None, exact=False):
+        """Calculate mixed strategy Nash equilibrium for 2-player games
+        
+        method is one of 'closed_form' (2x2 only), 'lemke_howson' (one equilibrium),
+        'support_enumeration' (list of all equilibria), 'lp' or 'first_order' (the
+        last two for constant-sum games only, see solve_zero_sum). By default 2x2
+        games with a fully mixed equilibrium use the closed form, larger constant-sum
+        games the zero-sum solver and all other games Lemke-Howson. Asking for the
+        closed form of a game without a fully mixed equilibrium raises ValueError.
+        Each profile carries an 'exploitability' entry, which is zero at an equilibrium.
+        
+        With exact=True payoffs are read as rationals and the closed form or support
+        enumeration returns Fraction probabilities with an exact exploitability, so
+        equilibria can be certified. The default route matches float mode, with
+        support enumeration in place of Lemke-Howson.
+        """
+        player1_strategies, player2_strategies, p1_payoffs, p2_payoffs = GameAnalyzer._bimatrix(
+            payoff_matrix, player1_strategies, player2_strategies)
+        
+        if exact:
+            return GameAnalyzer._exact_mixed_equilibrium(payoff_matrix, player1_strategies,
+                                                         player2_strategies, method)
+        
+        if method is None:
+            if p1_payoffs.shape == (2, 2):
+                solution = GameAnalyzer.solve_2x2_batch(np.stack([p1_payoffs, p2_payoffs], axis=-1)[np.newaxis])
+                method = 'closed_form' if solution['has_mixed'][0] else 'lemke_howson'
+            elif ZeroSumSolver.constant(p1_payoffs, p2_payoffs) is not None:
+                method = 'first_order' if p1_payoffs.size > ZeroSumSolver.LARGE else 'lp'
             else:
-                p = 0.5
+                method = 'lemke_howson'
+        
+        if method == 'closed_form':
+            if p1_payoffs.shape != (2, 2):
+                raise ValueError("The closed form only applies to 2x2 games")
             
-            return {
+            solution = GameAnalyzer.solve_2x2_batch(np.stack([p1_payoffs, p2_payoffs], axis=-1)[np.newaxis])
+            if not solution['has_mixed'][0]:
+                raise GameAnalyzer._no_closed_form(np.flatnonzero(solution['degenerate'][0]).tolist())
+            p, q = solution['mixed'][0].tolist()
+            result = {
                 'Player 1': {player1_strategies[0]: p, player1_strategies[1]: 1-p},
                 'Player 2': {player2_strategies[0]: q, player2_strategies[1]: 1-q}
             }
+        elif method == 'lemke_howson':
+            x, y = BimatrixSolver.lemke_howson(p1_payoffs, p2_payoffs)
+            result = GameAnalyzer._mixed_profile(x, y, player1_strategies, player2_strategies)
+        elif method == 'support_enumeration':
+            result = [
+                GameAnalyzer._mixed_profile(x, y, player1_strategies, player2_strategies)
+                for x, y in BimatrixSolver.support_enumeration(p1_payoffs, p2_payoffs)
+            ]
+        elif method in ('lp', 'first_order'):
+            result = GameAnalyzer.solve_mixed_equilibrium_lp(p1_payoffs, p2_payoffs, player1_strategies,
+                                                             player2_strategies, method=method)
         else:
-            # For larger games, use linear programming approach
-            return GameAnalyzer.solve_mixed_equilibrium_lp(p1_payoffs, p2_payoffs, 
-                                                         player1_strategies, player2_strategies)
+            raise ValueError(f"Unknown equilibrium method '{method}'")
+        
+        # Attach a quality field so callers can reject non-equilibria without re-solving
+        game = PayoffTensor([player1_strategies, player2_strategies], np.stack([p1_payoffs, p2_payoffs], axis=-1))
+        for profile in (result if isinstance(result, list) else [result]):
+            profile['exploitability'] = Exploitability.exploitability(
+                game, [profile['Player 1'], profile['Player 2']])
+        return result
 
     @staticmethod
-    def solve_mixed_equilibrium_lp(p1_payoffs, p2_payoffs, p1_strats, p2_strats):
-        """Solve for mixed equilibrium using linear programming"""
-        from scipy.optimize import linprog
-        
-        # Player 1's problem: find probabilities p that make Player 2 indifferent
-        num_p1 = len(p1_strats)
-        num_p2 = len(p2_strats)
-        
-        # Objective: maximize (v) which is the minimum expected payoff
-        c = np.zeros(num_p1 + 1)
-        c[-1] = -1  # We're maximizing v, which is equivalent to minimizing -v
-        
-        # Constraints: for each of Player 2's pure strategies, Player 1's expected payoff ≥ v
-        A_ub = []
-        for j in range(num_p2):
-            row = np.zeros(num_p1 + 1)
-            row[:num_p1] = -p2_payoffs[:, j]  # Note we use p2_payoffs because we're solving for p1
-            row[-1] = 1
-            A_ub.append(row)
-        A_ub = np.array(A_ub)
-        b_ub = np.zeros(num_p2)
-        
-        # Probabilities sum to 1 and are non-negative
-        A_eq = np.zeros((1, num_p1 + 1))
-        A_eq[0, :num_p1] = 1
-        b_eq = np.array([1])
-        
-        bounds = [(0, None) for _ in range(num_p1)] + [(None, None)]
+    def _bimatrix(payoff_matrix, player1_strategies=None, player2_strategies=None):
+        """Strategy lists and the two players' payoff matrices of a 2-player game"""
+        if not isinstance(payoff_matrix, dict):
+            payoff_matrix = PayoffTensor.from_game(payoff_matrix)
+            player1_strategies = player1_strategies or payoff_matrix.strategies[0]
+            player2_strategies = player2_strategies or payoff_matrix.strategies[1]
+            rows = [payoff_matrix.index[0][s] for s in player1_strategies]
+            cols = [payoff_matrix.index[1][s] for s in player2_strategies]
+            sub_game = payoff_matrix.payoffs[np.ix_(rows, cols)]
+            p1_payoffs, p2_payoffs = sub_game[..., 0], sub_game[..., 1]
+        else:
+            if player1_strategies is None or player2_strategies is None:
+                player1_strategies = list(dict.fromkeys(s[0] for s in payoff_matrix))
+                player2_strategies = list(dict.fromkeys(s[1] for s in payoff_matrix))
+            
+            # Convert payoff matrix to numpy arrays for easier calculation
+            p1_payoffs = np.zeros((len(player1_strategies), len(player2_strategies)))
+            p2_payoffs = np.zeros((len(player1_strategies), len(player2_strategies)))
+            
+            # Fill payoff matrices
+            for i, s1 in enumerate(player1_strategies):
+                for j, s2 in enumerate(player2_strategies):
+                    p1_payoffs[i,j], p2_payoffs[i,j] = payoff_matrix[(s1, s2)]
+        return player1_strategies, player2_strategies, p1_payoffs, p2_payoffs
+
+    @staticmethod
+    def _exact_mixed_equilibrium(payoff_matrix, p1_strats, p2_strats, method):
+        """Rational-arithmetic counterpart of find_mixed_strategy_equilibrium"""
+        lookup = payoff_matrix.__getitem__ if isinstance(payoff_matrix, dict) else payoff_matrix.get_payoff
+        # Read payoffs from the source so Fraction or integer entries never pass through floats
+        A = [[ExactSolver.to_fraction(lookup((s1, s2))[0]) for s2 in p2_strats] for s1 in p1_strats]
+        B = [[ExactSolver.to_fraction(lookup((s1, s2))[1]) for s2 in p2_strats] for s1 in p1_strats]
         
-        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds)
+        two_by_two = (len(p1_strats), len(p2_strats)) == (2, 2)
+        if two_by_two:
+            p, q = ExactSolver.solve_2x2(A, B)
+            interior = p is not None and q is not None and 0 < p < 1 and 0 < q < 1
+        single = method is None and two_by_two
+        if method is None:
+            # As in float mode, a 2x2 game without a fully mixed equilibrium gets one equilibrium from elsewhere
+            method = 'closed_form' if two_by_two and interior else 'support_enumeration'
         
-        if res.success:
-            p1_probs = res.x[:num_p1]
+        if method == 'closed_form':
+            if not two_by_two:
+                raise ValueError("The closed form only applies to 2x2 games")
+            if not interior:
+                raise GameAnalyzer._no_closed_form([k for k, mix in enumerate((p, q)) if mix is None])
+            profiles = [([p, 1 - p], [q, 1 - q])]
+        elif method == 'support_enumeration':
+            profiles = list(ExactSolver.support_enumeration(A, B))
         else:
-            p1_probs = np.ones(num_p1) / num_p1  # Fallback to uniform if no solution
-            
-        # Similarly solve for Player 2's probabilities
-        c = np.zeros(num_p2 + 1)
-        c[-1] = -1
+            raise ValueError(f"Exact mode supports 'closed_form' and 'support_enumeration', not '{method}'")
         
-        A_ub = []
-        for i in range(num_p1):
-            row = np.zeros(num_p2 + 1)
-            row[:num_p2] = -p1_payoffs[i, :]
-            row[-1] = 1
-            A_ub.append(row)
-        A_ub = np.array(A_ub)
-        b_ub = np.zeros(num_p1)
+        result = []
+        for x, y in profiles:
+            result.append({
+                'Player 1': dict(zip(p1_strats, x)),
+                'Player 2': dict(zip(p2_strats, y)),
+                'exploitability': ExactSolver.exploitability(A, B, x, y)
+            })
+        if single and not result:
+            raise ValueError("Support enumeration found no equilibrium; the game is degenerate")
+        return result[0] if method == 'closed_form' or single else result
+    
+    @staticmethod
+    def _no_closed_form(degenerate):
+        """ValueError for a 2x2 game without a fully mixed equilibrium; degenerate lists 0-based players"""
+        names = [f"Player {k + 1}" for k in degenerate]
+        reason = (f"no mix of {' or '.join(names)} makes the opponent indifferent" if names
+                  else "the indifference point lies outside (0, 1)")
+        return ValueError(f"The closed form needs a fully mixed equilibrium, but {reason}")
+
+    @staticmethod
+    def solve_2x2_batch(payoffs):
+        """Solve a stack of 2x2 games of shape (B, 2, 2, 2) in one vectorized pass
         
-        A_eq = np.zeros((1, num_p2 + 1))
-        A_eq[0, :num_p2] = 1
-        b_eq = np.array([1])
+        Returns a dict of arrays: 'mixed' (B, 2) holds the probability each player puts
+        on their first strategy in the indifference solution (NaN where it is undefined),
+        'has_mixed' (B,) marks games with a fully mixed equilibrium, 'degenerate' (B, 2)
+        marks players whose opponent is indifferent everywhere, and 'pure' (B, 2, 2)
+        marks the pure equilibria.
+        """
+        payoffs = np.asarray(payoffs, dtype=float)
+        if payoffs.ndim != 4 or payoffs.shape[1:] != (2, 2, 2):
+            raise ValueError(f"Expected payoffs of shape (B, 2, 2, 2), got {payoffs.shape}")
+        A, B = payoffs[..., 0], payoffs[..., 1]
         
-        bounds = [(0, None) for _ in range(num_p2)] + [(None, None)]
+        # Player 1's gain from the first row against each column of Player 2
+        a = A[:, 0, 0] - A[:, 1, 0]
+        b = A[:, 0, 1] - A[:, 1, 1]
+        # Player 2's gain from the first column against each row of Player 1
+        c = B[:, 0, 0] - B[:, 0, 1]
+        d = B[:, 1, 0] - B[:, 1, 1]
         
-        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds)
+        degenerate = np.stack([c == d, a == b], axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = np.where(degenerate[:, 0], np.nan, d / (d - c))  # makes Player 2 indifferent
+            q = np.where(degenerate[:, 1], np.nan, b / (b - a))  # makes Player 1 indifferent
+        mixed = np.stack([p, q], axis=1)
+        has_mixed = np.all((mixed > 0) & (mixed < 1), axis=1)
         
-        if res.success:
-            p2_probs = res.x[:num_p2]
-        else:
-            p2_probs = np.ones(num_p2) / num_p2
-            
+        # Pure equilibria from the best-response masks of both players
+        pure = (A >= A.max(axis=1, keepdims=True)) & (B >= B.max(axis=2, keepdims=True))
+        
+        return {'mixed': mixed, 'has_mixed': has_mixed, 'degenerate': degenerate, 'pure': pure}
+
+    @staticmethod
+    def _mixed_profile(x, y, p1_strats, p2_strats):
+        """Label probability vectors with strategy names"""
         return {
-            'Player 1': {s: p for s, p in zip(p1_strats, p1_probs)},
-            'Player 2': {s: p for s, p in zip(p2_strats, p2_probs)}
+            'Player 1': {s: float(p) for s, p in zip(p1_strats, x)},
+            'Player 2': {s: float(p) for s, p in zip(p2_strats, y)}
         }
 
+    @staticmethod
+    def solve_mixed_equilibrium_lp(p1_payoffs, p2_payoffs, p1_strats, p2_strats, method='lp'):
+        """Solve a constant-sum game as the zero-sum game of Player 1's payoffs
+
+        'lp' solves one minimax LP and reads Player 2's strategy off its duals;
+        'first_order' runs the extragradient method, for very large matrices.
+        'value' is Player 1's equilibrium payoff.
+        """
+        if ZeroSumSolver.constant(p1_payoffs, p2_payoffs) is None:
+            raise ValueError("The zero-sum solver needs a constant-sum game")
+        value, x, y = ZeroSumSolver.solve(p1_payoffs, method='lp' if method == 'lp' else 'extragradient')
+        result = GameAnalyzer._mixed_profile(x, y, p1_strats, p2_strats)
+        result['value'] = value
+        return result
+
+    @staticmethod
+    def is_constant_sum(payoff_matrix):
+        """Whether the payoffs of a 2-player game add up to the same constant in every cell"""
+        _, _, p1_payoffs, p2_payoffs = GameAnalyzer._bimatrix(payoff_matrix)
+        return ZeroSumSolver.constant(p1_payoffs, p2_payoffs) is not None
+
+    @staticmethod
+    def solve_zero_sum(payoff_matrix, method=None):
+        """Value and optimal strategies of a constant-sum game
+
+        method is 'lp' or 'first_order'; by default very large games use the first-order
+        solver. Returns {'value', 'Player 1', 'Player 2'}, with the value for Player 1.
+        """
+        p1_strats, p2_strats, p1_payoffs, p2_payoffs = GameAnalyzer._bimatrix(payoff_matrix)
+        if method is None:
+            method = 'first_order' if p1_payoffs.size > ZeroSumSolver.LARGE else 'lp'
+        return GameAnalyzer.solve_mixed_equilibrium_lp(p1_payoffs, p2_payoffs, p1_strats, p2_strats,
+                                                       method=method)
+
     @staticmethod
     def calculate_expected_payoffs(payoff_matrix, mixed_strategy):
         """Calculate expected payoffs for a given mixed strategy profile"""
-        players = range(len(next(iter(payoff_matrix.values()))))
-        expected_payoffs = [0.0 for _ in players]
-        
-        # Get all possible pure strategy combinations
-        all_strategies = [list(strats.keys()) for strats in mixed_strategy.values()]
-        all_profiles = product(*all_strategies)
-        
-        for profile in all_profiles:
-            # Calculate probability of this profile occurring
-            prob = 1.0
-            for player, strategy in enumerate(profile):
-                prob *= mixed_strategy[player][strategy]
-            
-            # Add to expected payoffs
-            payoffs = payoff_matrix[profile]
-            for player in players:
-                expected_payoffs[player] += prob * payoffs[player]
+        payoff_matrix = PayoffTensor.from_game(payoff_matrix)
         
-        return expected_payoffs
+        probs = [payoff_matrix.probability_vector(player, mixed_strategy[player])
+                 for player in range(payoff_matrix.num_players)]
+        return payoff_matrix.expected_payoffs(probs).tolist()
+
+    @staticmethod
+    def calculate_expected_payoffs_batch(payoff_matrix, mixed_profiles):
+        """Expected payoffs of K mixed profiles, given as one (K, n_i) array per player"""
+        payoff_matrix = PayoffTensor.from_game(payoff_matrix)
+        return payoff_matrix.expected_payoffs_batch(mixed_profiles)
 
     @staticmethod
     def find_best_response(payoff_matrix, player, opponent_strategy):
         """Find best response for a player given opponent's strategy"""
-        max_payoff = -float('inf')
-        best_strategy = None
-        strategies = list({s[player] for s in payoff_matrix.keys()})
-        
-        for strategy in strategies:
-            # Create strategy profile with this strategy
-            profile = list(opponent_strategy)
-            profile.insert(player, strategy)
-            payoff = payoff_matrix[tuple(profile)][player]
-            
-            if payoff > max_payoff:
-                max_payoff = payoff
-                best_strategy = strategy
-        
-        return best_strategy
+        return BestResponseOracle.for_game(payoff_matrix).best_response(player, opponent_strategy)
 
     @staticmethod
-    def is_strategy_dominated(payoff_matrix, player, strategy):
-        """Check if a strategy is strictly dominated for a player"""
-        other_strategies = [s for s in {s[player] for s in payoff_matrix.keys()} if s != strategy]
-        
-        for alt_strategy in other_strategies:
-            dominated = True
-            for opp_strategy in {s for p, s in enumerate(next(iter(payoff_matrix.keys()))) if p != player}:
-                # Create both strategy profiles
-                profile_with_strat = list(opp_strategy)
-                profile_with_strat.insert(player, strategy)
-                
-                profile_with_alt = list(opp_strategy)
-                profile_with_alt.insert(player, alt_strategy)
-                
-                if payoff_matrix[tuple(profile_with_strat)][player] >= payoff_matrix[tuple(profile_with_alt)][player]:
-                    dominated = False
-                    break
-            
-            if dominated:
-                return True
+    def is_strategy_dominated(payoff_matrix, player, strategy, weak=False, mixed=False):
+        """Check if a strategy is strictly (or weakly) dominated for a player
         
-        return False
\ No newline at end of file
+        With mixed=True, domination by mixed strategies is also checked (one LP).
+        """
+        payoff_matrix = PayoffTensor.from_game(payoff_matrix)
+        return Dominance.is_dominated(payoff_matrix, player, strategy, weak=weak, mixed=mixed)
+
+    @staticmethod
+    def eliminate_dominated_strategies(payoff_matrix, weak=False, mixed=True):
+        """Iterated elimination of dominated strategies, returns (reduced game, trace)"""
+        payoff_matrix = PayoffTensor.from_game(payoff_matrix)
+        return Dominance.iterated_elimination(payoff_matrix, weak=weak, mixed=mixed)
+
+    @staticmethod
+    def find_correlated_equilibrium(payoff_matrix, objective='welfare', coarse=False):
+        """Correlated (or coarse correlated) equilibrium maximising welfare, the minimum payoff or entropy"""
+        return CorrelatedEquilibrium.solve(payoff_matrix, objective=objective, coarse=coarse)
\ No newline at end of file
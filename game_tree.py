@@ -1,50 +1,263 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch
+import numpy as np
+
+# Node kinds of the extensive form
+DECISION, CHANCE, TERMINAL = 0, 1, 2
 
 class GameTree:
-    def __init__(self):
-        self.graph = nx.DiGraph()
-        self.pos = {}
-        self.node_labels = {}
-        self.edge_labels = {}
+    """Extensive-form game tree that can also be drawn
+
+    Nodes are decision nodes (owned by a 0-based player index and grouped into
+    information sets), chance nodes (with edge probabilities) or terminal nodes
+    (with a payoff vector). Nodes added with only a label are decision nodes
+    without a player and can be drawn but not solved.
+
+    Storage is compact: nodes are integer ids into growable NumPy arrays, edges
+    are parallel arrays turned into CSR child offsets on demand, and labels are
+    interned. Naming a node is optional; edges always take integer ids, and
+    id_of() looks up a named node's id. matplotlib and networkx are only
+    imported by draw().
+    """
+    def __init__(self, capacity=64):
         self.current_y = 0
         self.level_height = 1
         self.node_width = 1
+
+        self.num_nodes = 0
+        self.kinds = np.zeros(capacity, dtype=np.int8)
+        self.players = np.full(capacity, -1, dtype=np.int32)
+        self.infosets = np.full(capacity, -1, dtype=np.int64)
+        self.parents = np.full(capacity, -1, dtype=np.int64)
+        self.positions = np.zeros((capacity, 2))
+        self.node_label = np.zeros(capacity, dtype=np.int32)
+        self.payoffs = np.full((capacity, 0), np.nan)
+
+        self.num_edges = 0
+        self.edge_parent = np.zeros(capacity, dtype=np.int64)
+        self.edge_child = np.zeros(capacity, dtype=np.int64)
+        self.edge_label = np.zeros(capacity, dtype=np.int32)
+        self.edge_probability = np.full(capacity, np.nan)
+
+        # Interned label strings, optional node names and keyed information sets
+        self.labels = [""]
+        self.label_ids = {"": 0}
+        self.ids = {}
+        self.names = {}
+        self.infoset_ids = {}
+        self.num_infosets = 0
+        self._infoset_keys = None
+        self._csr = None
     
-    def add_node(self, node_id, label="", level=0, position=None):
-        self.graph.add_node(node_id)
+    def add_node(self, node_id=None, label="", level=0, position=None, player=None, payoffs=None,
+                 infoset=None, chance=False):
+        """Add a node, optionally named node_id, and return its integer id
+
+        payoffs make it terminal, chance=True a chance node, otherwise it is a
+        decision node. Decision nodes of the same player that share an infoset
+        key form one information set; without a key each is its own set.
+        """
+        if node_id is not None and node_id in self.ids:
+            raise ValueError(f"A node named {node_id!r} already exists")
+        index = self.num_nodes
+        if index == len(self.kinds):
+            self._grow_nodes()
+        self.num_nodes += 1
+        self._csr = None
+        self._infoset_keys = None
+
+        if node_id is not None:
+            self.ids[node_id] = index
+            self.names[index] = node_id
         if position:
-            x, y = position
+            self.positions[index] = position
         else:
-            x = level * self.node_width
-            y = self.current_y - level * self.level_height
-        self.pos[node_id] = (x, y)
-        self.node_labels[node_id] = label
+            self.positions[index] = (level * self.node_width, self.current_y - level * self.level_height)
+        self.node_label[index] = self._intern(label)
+
+        if payoffs is not None:
+            self.kinds[index] = TERMINAL
+            if len(payoffs) > self.payoffs.shape[1]:
+                wider = np.full((len(self.payoffs), len(payoffs)), np.nan)
+                wider[:, :self.payoffs.shape[1]] = self.payoffs
+                self.payoffs = wider
+            self.payoffs[index, :len(payoffs)] = payoffs
+        elif chance:
+            self.kinds[index] = CHANCE
+        else:
+            self.kinds[index] = DECISION
+
+        if player is not None:
+            self.players[index] = player
+            if self.kinds[index] == DECISION:
+                if infoset is None:
+                    self.infosets[index] = self.num_infosets
+                    self.num_infosets += 1
+                else:
+                    self.infosets[index] = self.infoset_ids.setdefault((player, infoset), self.num_infosets)
+                    self.num_infosets = max(self.num_infosets, int(self.infosets[index]) + 1)
+        return index
+    
+    def add_edge(self, from_node, to_node, label="", probability=None):
+        """Connect two nodes by integer id; probability applies to chance edges
+
+        Every node has at most one parent. Build repeated subtrees separately;
+        the solvers recognise identical subtrees themselves.
+        """
+        parent, child = self._check_id(from_node), self._check_id(to_node)
+        if self.parents[child] != -1 or child == parent:
+            raise ValueError(f"Node {self.name(child)!r} already has a parent; a GameTree must stay a tree")
+        edge = self.num_edges
+        if edge == len(self.edge_parent):
+            self._grow_edges()
+        self.num_edges += 1
+        self._csr = None
+
+        self.parents[child] = parent
+        self.edge_parent[edge] = parent
+        self.edge_child[edge] = child
+        self.edge_label[edge] = self._intern(label)
+        self.edge_probability[edge] = np.nan if probability is None else probability
+    
+    @property
+    def root(self):
+        """Id of the first node that has no parent"""
+        return int(np.flatnonzero(self.parents[:self.num_nodes] == -1)[0])
+    
+    def id_of(self, name):
+        """Integer id of the node added under name"""
+        if name not in self.ids:
+            raise KeyError(f"No node named {name!r}")
+        return self.ids[name]
     
-    def add_edge(self, from_node, to_node, label=""):
-        self.graph.add_edge(from_node, to_node)
-        self.edge_labels[(from_node, to_node)] = label
+    def name(self, node):
+        """The name a node was added under, or its integer id"""
+        return self.names.get(node, node)
     
-    def draw(self, title="Extensive Form Game"):
+    def infoset_key(self, node):
+        """(player, key) naming a decision node's information set; keyless sets use the node's name"""
+        if self._infoset_keys is None:
+            self._infoset_keys = {index: key for key, index in self.infoset_ids.items()}
+        return self._infoset_keys.get(int(self.infosets[node]), (int(self.players[node]), self.name(node)))
+    
+    def children(self, node):
+        child_start, child, _ = self.csr()
+        return child[child_start[node]:child_start[node + 1]]
+    
+    def actions(self, node):
+        """Edge labels of a node's children, in the order they were added"""
+        child_start, _, edges = self.csr()
+        return [self.labels[i] for i in self.edge_label[edges[child_start[node]:child_start[node + 1]]]]
+    
+    def csr(self):
+        """(child_start, child, edge) arrays: node v's children are child[child_start[v]:child_start[v+1]]
+
+        edge maps each CSR slot back to the insertion-ordered edge arrays.
+        """
+        if self._csr is None:
+            parents = self.edge_parent[:self.num_edges]
+            edges = np.argsort(parents, kind='stable')
+            child_start = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(parents, minlength=self.num_nodes), out=child_start[1:])
+            self._csr = (child_start, self.edge_child[edges], edges)
+        return self._csr
+    
+    def to_arrays(self):
+        """Flat NumPy view of the game: children in CSR form (child_start offsets into child)
+
+        Chance edges without a probability share the remaining mass equally.
+        Payoff rows of non-terminal nodes are NaN.
+        """
+        n = self.num_nodes
+        child_start, child, edges = self.csr()
+        parents = self.edge_parent[edges]
+        probability = self.edge_probability[edges].copy()
+
+        chance = self.kinds[parents] == CHANCE
+        probability[~chance] = np.nan
+        missing = chance & np.isnan(probability)
+        if missing.any():
+            known = np.bincount(parents, weights=np.where(chance & ~missing, probability, 0), minlength=n)
+            unknown = np.bincount(parents, weights=missing, minlength=n)
+            probability[missing] = ((1 - known) / np.maximum(unknown, 1))[parents[missing]]
+
+        return {
+            'kind': self.kinds[:n].copy(),
+            'player': self.players[:n].astype(np.int64),
+            'infoset': self.infosets[:n].copy(),
+            'parent': self.parents[:n].copy(),
+            'child_start': child_start,
+            'child': child,
+            'probability': probability,
+            'payoffs': self.payoffs[:n].copy()
+        }
+    
+    def _check_id(self, node):
+        if not isinstance(node, (int, np.integer)) or isinstance(node, bool):
+            raise TypeError(f"Nodes are connected by integer id, got {node!r}; use id_of() for a named node")
+        if not 0 <= node < self.num_nodes:
+            raise IndexError(f"No node with id {node}")
+        return int(node)
+    
+    def _intern(self, label):
+        label = str(label)
+        index = self.label_ids.get(label)
+        if index is None:
+            index = self.label_ids[label] = len(self.labels)
+            self.labels.append(label)
+        return index
+    
+    def _grow_nodes(self):
+        size = 2 * len(self.kinds)
+        for name in ('kinds', 'players', 'infosets', 'parents', 'positions', 'node_label', 'payoffs'):
+            old = getattr(self, name)
+            new = np.full((size,) + old.shape[1:], -1 if name in ('players', 'infosets', 'parents') else 0,
+                          dtype=old.dtype)
+            if name == 'payoffs':
+                new[:] = np.nan
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def _grow_edges(self):
+        size = 2 * len(self.edge_parent)
+        for name in ('edge_parent', 'edge_child', 'edge_label', 'edge_probability'):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def draw(self, title="Extensive Form Game", path=None):
+        """Plot the tree; with a path the figure is saved there instead of shown"""
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        from matplotlib.patches import FancyArrowPatch
+        
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(self.num_nodes))
+        pos = {node: tuple(xy) for node, xy in enumerate(self.positions[:self.num_nodes].tolist())}
+        node_labels = {node: self.labels[i] for node, i in enumerate(self.node_label[:self.num_nodes].tolist())}
+        edge_labels = {
+            (u, v): self.labels[i] for u, v, i in zip(self.edge_parent[:self.num_edges].tolist(),
+                                                      self.edge_child[:self.num_edges].tolist(),
+                                                      self.edge_label[:self.num_edges].tolist())
+        }
+        
         plt.figure(figsize=(10, 6))
-        nx.draw_networkx_nodes(self.graph, self.pos, node_size=2000, node_color='lightblue')
-        nx.draw_networkx_labels(self.graph, self.pos, labels=self.node_labels, font_size=10)
+        nx.draw_networkx_nodes(graph, pos, node_size=2000, node_color='lightblue')
+        nx.draw_networkx_labels(graph, pos, labels=node_labels, font_size=10)
         
         # Draw curved edges with labels
         ax = plt.gca()
-        for (u, v), label in self.edge_labels.items():
+        for (u, v), label in edge_labels.items():
             arrow = FancyArrowPatch(
-                posA=self.pos[u],
-                posB=self.pos[v],
+                posA=pos[u],
+                posB=pos[v],
                 arrowstyle='->',
                 connectionstyle='arc3,rad=0.2',
                 color='black'
             )
             ax.add_patch(arrow)
             ax.text(
-                (self.pos[u][0] + self.pos[v][0]) / 2,
-                (self.pos[u][1] + self.pos[v][1]) / 2,
+                (pos[u][0] + pos[v][0]) / 2,
+                (pos[u][1] + pos[v][1]) / 2,
                 label,
                 horizontalalignment='center',
                 bbox=dict(facecolor='white', edgecolor='none', alpha=0.7)
@@ -53,4 +266,8 @@ class GameTree:
         plt.title(title)
         plt.axis('off')
         plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        if path:
+            plt.savefig(path)
+            plt.close()
+        else:
+            plt.show()
\ No newline at end of file
@@ -1,27 +1,78 @@
+import numpy as np
+from game import Game
 from game_tree import GameTree
+from game_analyzer import GameAnalyzer
 
-class HawkDoveGame:
+class HawkDoveGame(Game):
     def __init__(self, value=4, cost=2):
-        self.value = value
-        self.cost = cost
         self.players = ['Player 1', 'Player 2']
         self.strategies = ['Hawk', 'Dove']
+        self.value = value
+        self.cost = cost
+    
+    @property
+    def value(self):
+        return self._value
+    
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.invalidate()
+    
+    @property
+    def cost(self):
+        return self._cost
+    
+    @cost.setter
+    def cost(self, cost):
+        self._cost = cost
+        self.invalidate()
+    
+    @property
+    def payoffs(self):
+        """Payoff table, rebuilt from payoff_batch only after value or cost change"""
+        if getattr(self, '_payoffs', None) is None:
+            table = self.payoff_batch(self.value, self.cost)
+            self._payoffs = {
+                (s1, s2): tuple(table[i, j].tolist())
+                for i, s1 in enumerate(self.strategies) for j, s2 in enumerate(self.strategies)
+            }
+        return self._payoffs
+    
+    def invalidate(self):
+        super().invalidate()
+        self._payoffs = None
     
     def get_payoff(self, strategies):
-        s1, s2 = strategies
-        if s1 == 'Hawk' and s2 == 'Hawk':
-            return ((self.value - self.cost)/2, (self.value - self.cost)/2)
-        elif s1 == 'Hawk' and s2 == 'Dove':
-            return (self.value, 0)
-        elif s1 == 'Dove' and s2 == 'Hawk':
-            return (0, self.value)
-        else:
-            return (self.value/2, self.value/2)
+        return self.payoffs[tuple(strategies)]
+    
+    @staticmethod
+    def payoff_batch(value, cost):
+        """Payoff tensors of shape (B, 2, 2, 2) for arrays of values and costs, strategies ordered Hawk, Dove"""
+        value = np.asarray(value, dtype=float)
+        cost = np.asarray(cost, dtype=float)
+        fight = (value - cost) / 2
+        zero = np.zeros_like(value)
+        # Player 1's matrix; the game is symmetric so Player 2's is its transpose
+        A = np.stack([np.stack([fight, value], axis=-1),
+                      np.stack([zero, value / 2], axis=-1)], axis=-2)
+        return np.stack([A, np.swapaxes(A, -1, -2)], axis=-1)
+    
+    @staticmethod
+    def sweep(values, costs, processes=None):
+        """Equilibria for every (value, cost) pair of the grid, as columns"""
+        from sweep import ParameterSweep
+        
+        sweep = ParameterSweep(HawkDoveGame.payoff_batch, {'value': values, 'cost': costs},
+                               strategies=[['Hawk', 'Dove'], ['Hawk', 'Dove']])
+        return sweep.run(processes=processes)
     
     def find_nash_equilibrium(self):
-        pure_nash = [('Hawk', 'Dove'), ('Dove', 'Hawk')]
+        pure_nash = GameAnalyzer.find_pure_strategy_equilibria(self)
         
-        p = q = min(max(self.value / self.cost, 0), 1)
+        # Hawk share of the evolutionarily stable state: all Hawk once the
+        # prize is worth the cost of fighting, otherwise value / cost
+        p = q = 1.0 if self.value >= self.cost else self.value / self.cost
         
         mixed_nash = {
             'Player 1': {'Hawk': p, 'Dove': 1-p},
@@ -39,29 +90,35 @@ class HawkDoveGame:
         print(f"Dove\t\t{self.get_payoff(('Dove','Hawk'))}\t{self.get_payoff(('Dove','Dove'))}")
 
     def display_extensive_form(self):
+        self.extensive_form().draw("Hawk-Dove Game - Extensive Form")
+    
+    def extensive_form(self):
+        """Game tree with real payoffs; Player 2 moves without seeing Player 1's choice"""
         tree = GameTree()
         tree.level_height = 1.2
         
         # Root node
-        tree.add_node("root", "Player 1", level=0)
+        tree.add_node("root", "Player 1", level=0, player=0)
         
         # Player 1 actions
-        tree.add_node("P1_H", "Hawk", level=1, position=(-1.2, -1))
-        tree.add_node("P1_D", "Dove", level=1, position=(1.2, -1))
-        tree.add_edge("root", "P1_H", "Hawk")
-        tree.add_edge("root", "P1_D", "Dove")
+        tree.add_node("P1_H", "Hawk", level=1, position=(-1.2, -1),
+                      player=1, infoset="P2")
+        tree.add_node("P1_D", "Dove", level=1, position=(1.2, -1),
+                      player=1, infoset="P2")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_H"), "Hawk")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_D"), "Dove")
         
         # Player 2 actions
         for p1_action, x_pos in [("H", -1.2), ("D", 1.2)]:
             for p2_action in ["H", "D"]:
                 node_id = f"P2_{p1_action}_{p2_action}"
-                payoff = self.get_payoff(
-                    ("Hawk" if p1_action == "H" else "Dove"),
-                    ("Hawk" if p2_action == "H" else "Dove")
-                )
+                payoff = self.get_payoff((
+                    "Hawk" if p1_action == "H" else "Dove",
+                    "Hawk" if p2_action == "H" else "Dove"
+                ))
                 tree.add_node(node_id, f"Payoff: {payoff}", level=2, 
-                            position=(x_pos + (0.7 if p2_action == "D" else -0.7), -2.2))
-                tree.add_edge(f"P1_{p1_action}", node_id, 
+                            position=(x_pos + (0.7 if p2_action == "D" else -0.7), -2.2), payoffs=payoff)
+                tree.add_edge(tree.id_of(f"P1_{p1_action}"), tree.id_of(node_id), 
                             "Hawk" if p2_action == "H" else "Dove")
         
-        tree.draw("Hawk-Dove Game - Extensive Form")
\ No newline at end of file
+        return tree
\ No newline at end of file
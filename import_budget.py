@@ -0,0 +1,55 @@
+"""Import-time budget for the command-line entry points
+
+Each module is imported in a fresh interpreter under `python -X importtime`.
+The check fails if the module's cumulative import time is over its budget, or
+if importing it pulled in a package that only drawing or LP features need.
+Run `python import_budget.py` (exit status 1 on a regression).
+"""
+import os
+import subprocess
+import sys
+
+# Cumulative import time allowed per module in milliseconds (best of a few runs)
+BUDGETS = {
+    'main': 50,
+    'registry': 50,
+    'batch': 400,
+    'game_analyzer': 400,
+    'prisoners_dilemma': 400,
+    'battle_of_sexes': 400,
+    'matching_pennies': 400,
+    'hawk_dove': 400,
+    'custom_game': 400,
+}
+# Packages that must only load when a plot is drawn or an LP is solved
+LAZY = ('matplotlib', 'networkx', 'scipy', 'yaml', 'pyarrow')
+
+
+def measure(module):
+    """(cumulative import time in ms, heavy packages loaded) for one fresh import"""
+    code = f"import sys, {module}; print(' '.join(m for m in {LAZY!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000, proc.stdout.split()
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def main(repeat=3):
+    failures = 0
+    for module, budget in BUDGETS.items():
+        runs = [measure(module) for _ in range(repeat)]
+        elapsed = min(ms for ms, _ in runs)
+        heavy = runs[0][1]
+        ok = elapsed <= budget and not heavy
+        failures += not ok
+        note = f", loads {', '.join(heavy)}" if heavy else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<18} {elapsed:7.1f} ms (budget {budget} ms){note}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
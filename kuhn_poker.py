@@ -0,0 +1,53 @@
+from fractions import Fraction
+from itertools import permutations
+from game_tree import GameTree
+
+
+class KuhnPoker:
+    """Kuhn poker, the standard small benchmark for imperfect-information solvers
+
+    Each player antes 1 and is dealt one card from a deck of `cards` ranks. Player 1
+    checks or bets 1; after a check Player 2 checks or bets, and a bet is
+    answered by a fold or a call. The higher card wins the showdown. With the
+    usual three cards (J, Q, K) the game value for Player 1 is -1/18.
+    """
+
+    VALUE = Fraction(-1, 18)
+
+    def __init__(self, cards=3):
+        if cards < 2:
+            raise ValueError("Kuhn poker needs at least two cards")
+        self.cards = list("JQK") if cards == 3 else [str(rank) for rank in range(1, cards + 1)]
+
+    def extensive_form(self):
+        """Game tree with a chance deal; information sets are keyed by own card and betting history"""
+        n = len(self.cards)
+        tree = GameTree(capacity=10 * n * (n - 1) + 1)
+        root = tree.add_node("root", "Deal", chance=True)
+
+        def showdown(parent, action, payoff):
+            leaf = tree.add_node(label=f"Payoff: {payoff}", payoffs=payoff)
+            tree.add_edge(parent, leaf, action)
+
+        for first, second in permutations(range(n), 2):
+            card1, card2 = self.cards[first], self.cards[second]
+            win = 1 if first > second else -1
+
+            p1 = tree.add_node(label="Player 1", level=1, player=0, infoset=card1)
+            tree.add_edge(root, p1, card1 + card2, probability=1 / (n * (n - 1)))
+
+            # Player 1 checks: Player 2 checks to a showdown or bets
+            p2_check = tree.add_node(label="Player 2", level=2, player=1, infoset=card2 + "c")
+            tree.add_edge(p1, p2_check, "check")
+            showdown(p2_check, "check", (win, -win))
+            p1_bet = tree.add_node(label="Player 1", level=3, player=0, infoset=card1 + "cb")
+            tree.add_edge(p2_check, p1_bet, "bet")
+            showdown(p1_bet, "fold", (-1, 1))
+            showdown(p1_bet, "call", (2 * win, -2 * win))
+
+            # Player 1 bets: Player 2 folds or calls
+            p2_bet = tree.add_node(label="Player 2", level=2, player=1, infoset=card2 + "b")
+            tree.add_edge(p1, p2_bet, "bet")
+            showdown(p2_bet, "fold", (1, -1))
+            showdown(p2_bet, "call", (2 * win, -2 * win))
+        return tree
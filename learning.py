@@ -0,0 +1,75 @@
+import numpy as np
+from payoff_tensor import PayoffTensor
+from exploitability import Exploitability
+
+
+class LearningSolver:
+    """Fictitious play, regret matching and regret matching+ on any N-player game
+
+    Every iteration updates all players at once from their deviation payoffs.
+    Only running sums and averages are stored, so memory stays at O(sum |S_i|)
+    on top of the payoff tensor.
+    """
+
+    METHODS = ('fictitious_play', 'regret_matching', 'regret_matching_plus')
+
+    @staticmethod
+    def solve(game, method='regret_matching_plus', iterations=10000, tol=None, check_every=100):
+        """Run a learning dynamic and return its average strategy profile
+
+        With tol, stops as soon as the NashConv of the average profile drops to tol
+        (checked every check_every iterations).
+        """
+        if method not in LearningSolver.METHODS:
+            raise ValueError(f"Unknown learning method '{method}', expected one of {LearningSolver.METHODS}")
+        if iterations < 1:
+            raise ValueError(f"iterations must be at least 1, got {iterations}")
+        game = PayoffTensor.from_game(game)
+        sizes = game.shape
+
+        current = [np.full(n, 1.0 / n) for n in sizes]
+        average = [probs.copy() for probs in current]
+        regrets = [np.zeros(n) for n in sizes]
+        total_weight = 0.0
+        nash_conv = None
+
+        for t in range(1, iterations + 1):
+            deviations = game.deviation_payoffs(average if method == 'fictitious_play' else current)
+
+            if method == 'fictitious_play':
+                # Everyone best responds to the empirical average of the others' play
+                for player, values in enumerate(deviations):
+                    best = np.zeros(sizes[player])
+                    best[np.argmax(values)] = 1.0
+                    average[player] += (best - average[player]) / (t + 1)
+            else:
+                # RM+ clips regrets at zero and weights the average linearly in t
+                weight = t if method == 'regret_matching_plus' else 1.0
+                total_weight += weight
+                for player, values in enumerate(deviations):
+                    regrets[player] += values - values @ current[player]
+                    if method == 'regret_matching_plus':
+                        np.maximum(regrets[player], 0, out=regrets[player])
+                    average[player] += (weight / total_weight) * (current[player] - average[player])
+
+                    positive = np.maximum(regrets[player], 0)
+                    total = positive.sum()
+                    current[player] = positive / total if total > 0 else np.full(sizes[player], 1.0 / sizes[player])
+
+            if tol is not None and t % check_every == 0:
+                nash_conv = Exploitability.nash_conv(game, average)
+                if nash_conv <= tol:
+                    break
+
+        if nash_conv is None or t % check_every != 0:
+            nash_conv = Exploitability.nash_conv(game, average)
+
+        return {
+            'profile': {
+                f'Player {player + 1}': {s: float(p) for s, p in zip(game.strategies[player], probs)}
+                for player, probs in enumerate(average)
+            },
+            'strategies': average,
+            'nash_conv': nash_conv,
+            'iterations': t
+        }
@@ -1,21 +1,15 @@
-from prisoners_dilemma import PrisonersDilemma
-from battle_of_sexes import BattleOfTheSexes
-from matching_pennies import MatchingPennies
-from hawk_dove import HawkDoveGame
+import sys
+from registry import GameRegistry
 
 def main():
     print("Game Theory Simulator\n")
     
-    games = {
-        '1': ('Prisoner\'s Dilemma', PrisonersDilemma()),
-        '2': ('Battle of the Sexes', BattleOfTheSexes()),
-        '3': ('Matching Pennies', MatchingPennies()),
-        '4': ('Hawk-Dove Game', HawkDoveGame())
-    }
+    # Game modules are only imported once the game is picked
+    games = GameRegistry.names()
     
     while True:
         print("\nSelect a game to analyze:")
-        for key, (name, _) in games.items():
+        for key, name in games.items():
             print(f"{key}. {name}")
         print("5. Exit")
         
@@ -24,7 +18,7 @@ def main():
         if choice == '5':
             break
         elif choice in games:
-            name, game = games[choice]
+            name, game = GameRegistry.load(choice)
             print(f"\nAnalyzing {name}")
             
             print("\n=== Normal Form ===")
@@ -45,4 +39,8 @@ def main():
             print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
+    # Any arguments select the headless batch mode (see batch.py)
+    if len(sys.argv) > 1:
+        from batch import main as batch_main
+        sys.exit(batch_main(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -1,6 +1,8 @@
+from game import Game
 from game_tree import GameTree
+from game_analyzer import GameAnalyzer
 
-class MatchingPennies:
+class MatchingPennies(Game):
     def __init__(self):
         self.payoffs = {
             ('Heads', 'Heads'): (1, -1),
@@ -12,13 +14,11 @@ class MatchingPennies:
         self.strategies = ['Heads', 'Tails']
     
     def find_nash_equilibrium(self):
-        return {
-            'Player 1': {'Heads': 0.5, 'Tails': 0.5},
-            'Player 2': {'Heads': 0.5, 'Tails': 0.5}
-        }
+        """Optimal mixed strategies and the game value from the zero-sum solver"""
+        return GameAnalyzer.solve_zero_sum(self)
     
     def is_zero_sum(self):
-        return True
+        return GameAnalyzer.is_constant_sum(self)
     
     def display_normal_form(self):
         print("Matching Pennies - Normal Form")
@@ -28,17 +28,23 @@ class MatchingPennies:
         print(f"Tails\t\t{self.payoffs[('Tails','Heads')]}\t{self.payoffs[('Tails','Tails')]}")
 
     def display_extensive_form(self):
+        self.extensive_form().draw("Matching Pennies - Extensive Form")
+    
+    def extensive_form(self):
+        """Game tree with real payoffs; Player 2 moves without seeing Player 1's choice"""
         tree = GameTree()
         tree.node_width = 1.5
         
         # Root node
-        tree.add_node("root", "Player 1", level=0)
+        tree.add_node("root", "Player 1", level=0, player=0)
         
         # Player 1 actions
-        tree.add_node("P1_H", "Heads", level=1, position=(-1, -1))
-        tree.add_node("P1_T", "Tails", level=1, position=(1, -1))
-        tree.add_edge("root", "P1_H", "Heads")
-        tree.add_edge("root", "P1_T", "Tails")
+        tree.add_node("P1_H", "Heads", level=1, position=(-1, -1),
+                      player=1, infoset="P2")
+        tree.add_node("P1_T", "Tails", level=1, position=(1, -1),
+                      player=1, infoset="P2")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_H"), "Heads")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_T"), "Tails")
         
         # Player 2 actions
         for p1_action, x_pos in [("H", -1), ("T", 1)]:
@@ -46,11 +52,11 @@ class MatchingPennies:
                 node_id = f"P2_{p1_action}_{p2_action}"
                 payoff = self._get_payoff_for_tree(p1_action, p2_action)
                 tree.add_node(node_id, f"Payoff: {payoff}", level=2, 
-                            position=(x_pos + (0.5 if p2_action == "T" else -0.5), -2))
-                tree.add_edge(f"P1_{p1_action}", node_id, 
+                            position=(x_pos + (0.5 if p2_action == "T" else -0.5), -2), payoffs=payoff)
+                tree.add_edge(tree.id_of(f"P1_{p1_action}"), tree.id_of(node_id), 
                             "Heads" if p2_action == "H" else "Tails")
         
-        tree.draw("Matching Pennies - Extensive Form")
+        return tree
     
     def _get_payoff_for_tree(self, p1_action, p2_action):
         p1_strat = "Heads" if p1_action == "H" else "Tails"
@@ -0,0 +1,188 @@
+import hashlib
+import numpy as np
+from itertools import product
+
+
+class PayoffTensor:
+    """Dense N-player game: one array axis per player plus a trailing payoff axis"""
+
+    def __init__(self, strategies, payoffs):
+        self.strategies = [list(strats) for strats in strategies]
+        self.payoffs = np.asarray(payoffs, dtype=float)
+
+        expected_shape = tuple(len(strats) for strats in self.strategies) + (len(self.strategies),)
+        if self.payoffs.shape != expected_shape:
+            raise ValueError(f"Payoff array has shape {self.payoffs.shape}, expected {expected_shape}")
+
+        # Name <-> index tables, one per player
+        self.index = [{s: i for i, s in enumerate(strats)} for strats in self.strategies]
+        # Bumped by touch(); caches built from this tensor compare it to spot in-place changes
+        self.version = 0
+        self._payoff_major = None
+        self._hash = None
+        self._derived = {}
+
+    @classmethod
+    def from_dict(cls, payoff_matrix, strategies=None):
+        """Build a tensor from a dict keyed by strategy-name tuples"""
+        profiles = list(payoff_matrix.keys())
+        num_players = len(profiles[0])
+
+        if strategies is None:
+            # Keep strategies in the order they first appear in the dict
+            strategies = [list(dict.fromkeys(p[player] for p in profiles))
+                          for player in range(num_players)]
+
+        index = [{s: i for i, s in enumerate(strats)} for strats in strategies]
+        shape = tuple(len(strats) for strats in strategies)
+
+        # Convert every key once, then scatter all payoffs in a single assignment
+        coords = np.array([[index[player][s] for player, s in enumerate(p)] for p in profiles],
+                          dtype=np.intp).reshape(len(profiles), num_players)
+        if len(np.unique(np.ravel_multi_index(coords.T, shape))) != int(np.prod(shape)):
+            raise ValueError("Payoff matrix does not cover every strategy profile")
+
+        payoffs = np.empty(shape + (num_players,))
+        payoffs[tuple(coords.T)] = np.array(list(payoff_matrix.values()), dtype=float)
+        return cls(strategies, payoffs)
+
+    @classmethod
+    def from_game(cls, game):
+        """Build a tensor from a payoff dict or any game object; Game subclasses return their cached one"""
+        if isinstance(game, cls):
+            return game
+        if hasattr(game, 'tensor'):
+            return game.tensor()
+        if isinstance(game, dict):
+            return cls.from_dict(game)
+        if hasattr(game, 'payoff_matrix'):
+            return cls.from_dict(game.payoff_matrix, game.strategies)
+        if hasattr(game, 'payoffs'):
+            return cls.from_dict(game.payoffs)
+        # Games such as HawkDoveGame only compute payoffs on demand
+        strategies = [game.strategies] * len(game.players)
+        return cls.from_dict({profile: game.get_payoff(profile) for profile in product(*strategies)},
+                             strategies)
+
+    @property
+    def num_players(self):
+        return len(self.strategies)
+
+    @property
+    def shape(self):
+        return self.payoffs.shape[:-1]
+
+    def profile_index(self, profile):
+        """Map a tuple of strategy names to a tuple of array indices"""
+        return tuple(self.index[player][s] for player, s in enumerate(profile))
+
+    def profile_names(self, indices):
+        """Map a tuple of array indices to a tuple of strategy names"""
+        return tuple(self.strategies[player][i] for player, i in enumerate(indices))
+
+    def get_payoff(self, profile):
+        return tuple(self.payoffs[self.profile_index(profile)].tolist())
+
+    def set_payoff(self, profile, payoffs):
+        """Change one profile's payoffs in place"""
+        self.payoffs[self.profile_index(profile)] = payoffs
+        self.touch()
+
+    def touch(self):
+        """Record an in-place change to self.payoffs, dropping results cached from the old values"""
+        self.version += 1
+        self._payoff_major = None
+        self._hash = None
+        self._derived = {}
+
+    def cached(self, key, build):
+        """build(self), computed once per key and version of this tensor
+
+        Lets analyzers keep derived tables (such as best-response oracles) with
+        the tensor they came from; touch() drops them.
+        """
+        version, value = self._derived.get(key, (None, None))
+        if version != self.version:
+            value = build(self)
+            self._derived[key] = (self.version, value)
+        return value
+
+    def player_payoffs(self, player):
+        """Payoff array of a single player, one axis per player"""
+        return self.payoffs[..., player]
+
+    def probability_vector(self, player, mixed):
+        """Dense probability vector for a player from a {strategy: prob} dict or an array"""
+        if isinstance(mixed, dict):
+            probs = np.zeros(self.shape[player])
+            for strategy, prob in mixed.items():
+                probs[self.index[player][strategy]] = prob
+            return probs
+        return np.asarray(mixed, dtype=float)
+
+    def expected_payoffs(self, probs):
+        """Expected payoff of every player when each plays the given probability vector"""
+        values = self._payoffs_first()
+        for vector in reversed(probs):
+            values = values @ vector
+        return values
+
+    def expected_payoffs_batch(self, probs):
+        """Expected payoffs of K mixed profiles at once
+
+        probs holds one (K, n_i) array per player; returns a (K, num_players) array.
+        """
+        probs = [np.asarray(batch, dtype=float) for batch in probs]
+        # The last player's axis becomes the batch axis with one matmul ...
+        values = self._payoffs_first() @ probs[-1].T
+        # ... and every other axis is contracted row by row against its profile
+        for batch in reversed(probs[:-1]):
+            values = np.einsum('...ik,ki->...k', values, batch)
+        return values.T
+
+    def deviation_payoffs(self, probs):
+        """Each player's payoff for every pure strategy against the others' mixed strategies"""
+        payoffs = self._payoffs_first()
+        deviations = []
+        for player in range(self.num_players):
+            values = payoffs[player]
+            # Contract from the last axis down so earlier axis positions stay valid
+            for other in reversed(range(self.num_players)):
+                if other != player:
+                    values = np.tensordot(values, probs[other], axes=(other, 0))
+            deviations.append(values)
+        return deviations
+
+    def deviation_payoffs_batch(self, probs):
+        """deviation_payoffs for K profiles at once: one (K, n_i) array per player in and out"""
+        probs = [np.asarray(batch, dtype=float) for batch in probs]
+        payoffs = self._payoffs_first()
+        deviations = []
+        for player in range(self.num_players):
+            others = [p for p in range(self.num_players) if p != player]
+            # The first contraction turns that opponent's axis into a trailing batch axis
+            values = np.tensordot(payoffs[player], probs[others[-1]], axes=(others[-1], 1))
+            for other in reversed(others[:-1]):
+                values = np.einsum('...ik,ki->...k', np.moveaxis(values, other, -2), probs[other])
+            deviations.append(values.T)
+        return deviations
+
+    def _payoffs_first(self):
+        """Payoff array with the payoff axis first, so each contraction is a matmul over the trailing axis"""
+        if self._payoff_major is None:
+            self._payoff_major = np.ascontiguousarray(np.moveaxis(self.payoffs, -1, 0))
+        return self._payoff_major
+
+    def content_hash(self):
+        """Digest of strategy names and payoff values, stable across equal games (computed once)"""
+        if self._hash is None:
+            digest = hashlib.sha1(repr(self.strategies).encode())
+            digest.update(np.ascontiguousarray(self.payoffs).tobytes())
+            self._hash = digest.hexdigest()
+        return self._hash
+
+    def to_dict(self):
+        return {
+            self.profile_names(idx): tuple(self.payoffs[idx].tolist())
+            for idx in np.ndindex(*self.shape)
+        }
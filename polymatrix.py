@@ -0,0 +1,118 @@
+import numpy as np
+
+
+class PolymatrixGame:
+    """Graphical game where each player's payoff is a sum of pairwise games with its neighbours
+
+    edges[(i, j)] = (A, B) stores the bimatrix game between players i and j: A[a, b]
+    is i's payoff and B[a, b] is j's payoff when i plays a and j plays b. Storage is
+    linear in the number of edges instead of exponential in the number of players.
+    """
+
+    def __init__(self, strategies, edges=None):
+        self.strategies = [list(strats) for strats in strategies]
+        self.index = [{s: i for i, s in enumerate(strats)} for strats in self.strategies]
+        # neighbours[i] maps j -> i's payoff matrix against j (rows: i's strategies)
+        self.neighbours = [{} for _ in self.strategies]
+        for (i, j), (A, B) in (edges or {}).items():
+            self.add_edge(i, j, A, B)
+
+    @property
+    def num_players(self):
+        return len(self.strategies)
+
+    @property
+    def num_edges(self):
+        return sum(len(n) for n in self.neighbours) // 2
+
+    def add_edge(self, i, j, A, B):
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float)
+        expected = (len(self.strategies[i]), len(self.strategies[j]))
+        if A.shape != expected or B.shape != expected:
+            raise ValueError(f"Edge ({i}, {j}) needs {expected} payoff matrices")
+        self.neighbours[i][j] = self.neighbours[i].get(j, 0) + A
+        self.neighbours[j][i] = self.neighbours[j].get(i, 0) + B.T
+
+    def payoff_vector(self, player, assignment):
+        """Payoff of each of the player's strategies given neighbours' pure strategy indices"""
+        values = np.zeros(len(self.strategies[player]))
+        for j, M in self.neighbours[player].items():
+            values += M[:, assignment[j]]
+        return values
+
+    def get_payoff(self, profile):
+        idx = [self.index[p][s] for p, s in enumerate(profile)]
+        return tuple(float(self.payoff_vector(p, idx)[idx[p]]) for p in range(self.num_players))
+
+    def expected_payoffs(self, mixed):
+        """Expected payoffs of a mixed profile in O(sum of edge sizes)
+
+        mixed holds one probability vector (or {strategy: prob} dict) per player.
+        """
+        probs = []
+        for player, strategy in enumerate(mixed):
+            if isinstance(strategy, dict):
+                vector = np.zeros(len(self.strategies[player]))
+                for s, p in strategy.items():
+                    vector[self.index[player][s]] = p
+                strategy = vector
+            probs.append(np.asarray(strategy, dtype=float))
+        return [
+            float(sum(probs[i] @ M @ probs[j] for j, M in self.neighbours[i].items()))
+            for i in range(self.num_players)
+        ]
+
+    def find_pure_equilibria(self, limit=None):
+        """Pure equilibria by backtracking search with constraint propagation over neighbourhoods
+
+        A player's best-response constraint only involves its closed neighbourhood.
+        Whenever every neighbour of an unassigned player is fixed, its domain is
+        narrowed to its best responses; whenever a player and all its neighbours
+        are fixed, its constraint is checked. Dead ends are detected as soon as a
+        domain empties.
+        """
+        n = self.num_players
+        domains = [set(range(len(strats))) for strats in self.strategies]
+        assignment = [None] * n
+        # Visit high-degree players first; neighbours then become fixed early
+        order = sorted(range(n), key=lambda p: -len(self.neighbours[p]))
+        results = []
+
+        # Explicit stack of (depth, saved domains) frames keeps deep graphs off the recursion limit
+        stack = [(0, [set(d) for d in domains], list(assignment))]
+        while stack:
+            depth, domains, assignment = stack.pop()
+            if depth == n:
+                results.append(tuple(self.strategies[p][assignment[p]] for p in range(n)))
+                if limit is not None and len(results) >= limit:
+                    break
+                continue
+
+            player = order[depth]
+            for choice in sorted(domains[player], reverse=True):
+                new_assignment = list(assignment)
+                new_assignment[player] = choice
+                new_domains = [set(d) for d in domains]
+                new_domains[player] = {choice}
+                if self._propagate(player, new_assignment, new_domains):
+                    stack.append((depth + 1, new_domains, new_assignment))
+        return results
+
+    def _propagate(self, player, assignment, domains):
+        """Apply the consequences of assigning `player`; False on contradiction"""
+        for q in [player] + list(self.neighbours[player]):
+            if not all(assignment[j] is not None for j in self.neighbours[q]):
+                continue
+            values = self.payoff_vector(q, assignment)
+            best = set(np.flatnonzero(values >= values.max() - 1e-12).tolist())
+            if assignment[q] is not None:
+                # Fully fixed neighbourhood: q must be best responding
+                if assignment[q] not in best:
+                    return False
+            else:
+                # All neighbours fixed: only best responses remain possible for q
+                domains[q] &= best
+                if not domains[q]:
+                    return False
+        return True
@@ -1,7 +1,9 @@
+from game import Game
 from game_tree import GameTree
 from game_analyzer import GameAnalyzer
+from best_response import BestResponseOracle
 
-class PrisonersDilemma:
+class PrisonersDilemma(Game):
     def __init__(self):
         self.payoffs = {
             ('Cooperate', 'Cooperate'): (-1, -1),
@@ -16,24 +18,23 @@ class PrisonersDilemma:
         analyzer = GameAnalyzer()
         
         print("\n=== Pure Strategy Analysis ===")
-        pure_eq = analyzer.find_pure_strategy_equilibria(self.payoffs)
+        pure_eq = analyzer.find_pure_strategy_equilibria(self)
         print(f"Pure Strategy Nash Equilibria: {pure_eq}")
         
         print("\n=== Mixed Strategy Analysis ===")
-        mixed_eq = analyzer.find_mixed_strategy_equilibrium(
-            self.payoffs, self.strategies, self.strategies)
+        mixed_eq = analyzer.find_mixed_strategy_equilibrium(self)
         print(f"Mixed Strategy Nash Equilibrium: {mixed_eq}")
         
         if mixed_eq:
             expected_payoffs = analyzer.calculate_expected_payoffs(
-                self.payoffs, 
+                self, 
                 {0: mixed_eq['Player 1'], 1: mixed_eq['Player 2']}
             )
             print(f"Expected Payoffs in Mixed NE: {expected_payoffs}")
         
         print("\n=== Dominance Analysis ===")
         for player, strategy in enumerate(self.strategies):
-            dominated = analyzer.is_strategy_dominated(self.payoffs, player, strategy)
+            dominated = analyzer.is_strategy_dominated(self, player, strategy)
             print(f"{self.players[player]}'s strategy '{strategy}' is dominated: {dominated}")
         
         print("\n=== Best Response Analysis ===")
@@ -41,35 +42,17 @@ class PrisonersDilemma:
             print(f"\n{self.players[player]}'s best responses:")
             opponent = 1 - player
             for opp_strategy in self.strategies:
-                br = analyzer.find_best_response(self.payoffs, player, [opp_strategy])
+                br = analyzer.find_best_response(self, player, [opp_strategy])
                 print(f"Against {opp_strategy}: {br}")
     
-    def get_payoff(self, strategies):
-        return self.payoffs[strategies]
-    
     def find_nash_equilibrium(self):
-        best_responses = {0: {}, 1: {}}
-        
-        for player in [0, 1]:
-            opponent = 1 - player
-            for opp_strategy in self.strategies:
-                max_payoff = -float('inf')
-                best_strategy = None
-                for strategy in self.strategies:
-                    if player == 0:
-                        payoff = self.payoffs[(strategy, opp_strategy)][player]
-                    else:
-                        payoff = self.payoffs[(opp_strategy, strategy)][player]
-                    if payoff > max_payoff:
-                        max_payoff = payoff
-                        best_strategy = strategy
-                best_responses[player][opp_strategy] = best_strategy
+        oracle = BestResponseOracle.for_game(self)
         
         nash_eq = []
         for s1 in self.strategies:
             for s2 in self.strategies:
-                if (best_responses[0][s2] == s1 and 
-                    best_responses[1][s1] == s2):
+                if (s1 in oracle.best_responses(0, [s2]) and 
+                    s2 in oracle.best_responses(1, [s1])):
                     nash_eq.append((s1, s2))
         
         return nash_eq
@@ -82,27 +65,31 @@ class PrisonersDilemma:
         print(f"Defect\t\t{self.payoffs[('Defect','Cooperate')]}\t{self.payoffs[('Defect','Defect')]}")
 
     def display_extensive_form(self):
+        self.extensive_form().draw("Prisoner's Dilemma - Extensive Form")
+    
+    def extensive_form(self):
+        """Game tree with real payoffs; neither player observes Nature's draw or the other's move"""
         tree = GameTree()
         
         # Root node
-        tree.add_node("root", "Nature", level=0)
+        tree.add_node("root", "Nature", level=0, chance=True)
         
         # Player 1 decision
-        tree.add_node("P1", "Player 1", level=1, position=(-1.5, 0))
-        tree.add_node("P1_2", "Player 1", level=1, position=(1.5, 0))
-        tree.add_edge("root", "P1", "50%")
-        tree.add_edge("root", "P1_2", "50%")
+        tree.add_node("P1", "Player 1", level=1, position=(-1.5, 0), player=0, infoset="P1")
+        tree.add_node("P1_2", "Player 1", level=1, position=(1.5, 0), player=0, infoset="P1")
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1"), "50%", probability=0.5)
+        tree.add_edge(tree.id_of("root"), tree.id_of("P1_2"), "50%", probability=0.5)
         
         # Player 1 actions
-        tree.add_node("P1_C", "Cooperate", level=2, position=(-2, -1))
-        tree.add_node("P1_D", "Defect", level=2, position=(-1, -1))
-        tree.add_edge("P1", "P1_C", "Cooperate")
-        tree.add_edge("P1", "P1_D", "Defect")
+        tree.add_node("P1_C", "Cooperate", level=2, position=(-2, -1), player=1, infoset="P2")
+        tree.add_node("P1_D", "Defect", level=2, position=(-1, -1), player=1, infoset="P2")
+        tree.add_edge(tree.id_of("P1"), tree.id_of("P1_C"), "Cooperate")
+        tree.add_edge(tree.id_of("P1"), tree.id_of("P1_D"), "Defect")
         
-        tree.add_node("P1_C2", "Cooperate", level=2, position=(1, -1))
-        tree.add_node("P1_D2", "Defect", level=2, position=(2, -1))
-        tree.add_edge("P1_2", "P1_C2", "Cooperate")
-        tree.add_edge("P1_2", "P1_D2", "Defect")
+        tree.add_node("P1_C2", "Cooperate", level=2, position=(1, -1), player=1, infoset="P2")
+        tree.add_node("P1_D2", "Defect", level=2, position=(2, -1), player=1, infoset="P2")
+        tree.add_edge(tree.id_of("P1_2"), tree.id_of("P1_C2"), "Cooperate")
+        tree.add_edge(tree.id_of("P1_2"), tree.id_of("P1_D2"), "Defect")
         
         # Player 2 actions
         for p1_action, x_pos in [("C", -2), ("D", -1), ("C2", 1), ("D2", 2)]:
@@ -110,11 +97,11 @@ class PrisonersDilemma:
                 node_id = f"P2_{p1_action}_{p2_action}"
                 payoff = self._get_payoff_for_tree(p1_action, p2_action)
                 tree.add_node(node_id, f"Payoff: {payoff}", level=3, 
-                            position=(x_pos + (0.5 if p2_action == "D" else -0.5), -2))
-                tree.add_edge(f"P1_{p1_action}", node_id, 
+                            position=(x_pos + (0.5 if p2_action == "D" else -0.5), -2), payoffs=payoff)
+                tree.add_edge(tree.id_of(f"P1_{p1_action}"), tree.id_of(node_id), 
                             "Cooperate" if p2_action == "C" else "Defect")
         
-        tree.draw("Prisoner's Dilemma - Extensive Form")
+        return tree
     
     def _get_payoff_for_tree(self, p1_action, p2_action):
         # Map tree actions to actual strategies
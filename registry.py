@@ -0,0 +1,39 @@
+import importlib
+
+
+class GameRegistry:
+    """Bundled games by menu key; a game's module is only imported when it is first loaded"""
+
+    GAMES = {
+        '1': ("Prisoner's Dilemma", 'prisoners_dilemma', 'PrisonersDilemma'),
+        '2': ('Battle of the Sexes', 'battle_of_sexes', 'BattleOfTheSexes'),
+        '3': ('Matching Pennies', 'matching_pennies', 'MatchingPennies'),
+        '4': ('Hawk-Dove Game', 'hawk_dove', 'HawkDoveGame')
+    }
+    _instances = {}
+
+    @classmethod
+    def register(cls, key, name, module, class_name):
+        cls.GAMES[key] = (name, module, class_name)
+        cls._instances.pop(key, None)
+
+    @classmethod
+    def names(cls):
+        return {key: name for key, (name, _, _) in cls.GAMES.items()}
+
+    @classmethod
+    def create(cls, game, **params):
+        """New instance of a game named by key, module, class or display name, built with params"""
+        wanted = str(game).lower()
+        for key, (name, module, class_name) in cls.GAMES.items():
+            if wanted in (key, name.lower(), module, class_name.lower()):
+                return getattr(importlib.import_module(module), class_name)(**params)
+        raise ValueError(f"Unknown game '{game}'")
+
+    @classmethod
+    def load(cls, key):
+        """(name, game instance) for a key, importing and constructing the game once"""
+        name, module, class_name = cls.GAMES[key]
+        if key not in cls._instances:
+            cls._instances[key] = getattr(importlib.import_module(module), class_name)()
+        return name, cls._instances[key]
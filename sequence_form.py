@@ -0,0 +1,153 @@
+import numpy as np
+from game_tree import DECISION, CHANCE, TERMINAL
+
+
+class SequenceFormSolver:
+    """Exact equilibria of two-player zero-sum extensive games via the sequence form
+
+    Strategies are realization plans over sequences (the empty sequence plus one
+    sequence per information set and action), so the LP has size linear in the
+    tree instead of exponential like the induced normal form. The constraint and
+    payoff matrices are built as scipy.sparse matrices from one top-down pass.
+    """
+
+    TOL = 1e-9
+
+    @staticmethod
+    def build(tree):
+        """Sequence-form data of a GameTree: E, e, F, f, the sparse payoff matrix A and sequence layouts"""
+        from scipy.sparse import coo_matrix
+
+        arrays = tree.to_arrays()
+        kind, player, payoffs = arrays['kind'], arrays['player'], arrays['payoffs']
+        child_start, child = arrays['child_start'], arrays['child']
+        n = len(kind)
+        counts = np.diff(child_start)
+        if payoffs.shape[1] != 2:
+            raise ValueError("The sequence form applies to two-player games")
+        terminal = kind == TERMINAL
+        sums = payoffs[terminal].sum(axis=1)
+        if len(sums) and np.ptp(sums) > SequenceFormSolver.TOL * max(1.0, np.abs(payoffs[terminal]).max()):
+            raise ValueError("The sequence-form LP needs a zero-sum (or constant-sum) game")
+
+        # Per player: compact information sets, their actions and sequence numbers (0 is the empty sequence)
+        layouts = []
+        node_infoset = np.full(n, -1, dtype=np.int64)
+        for p in range(2):
+            nodes = np.flatnonzero((kind == DECISION) & (player == p))
+            ids, compact = np.unique(arrays['infoset'][nodes], return_inverse=True)
+            node_infoset[nodes] = compact
+            num_actions = np.zeros(len(ids), dtype=np.int64)
+            num_actions[compact] = counts[nodes]
+            if np.any(num_actions[compact] != counts[nodes]):
+                raise ValueError("Nodes of one information set must all have the same number of actions")
+            first_sequence = np.ones(len(ids) + 1, dtype=np.int64)
+            np.cumsum(num_actions, out=first_sequence[1:])
+            first_sequence[1:] += 1
+            first_node = np.full(len(ids), -1, dtype=np.int64)
+            first_node[compact[::-1]] = nodes[::-1]
+            layouts.append({'nodes': nodes, 'infoset': compact, 'num_actions': num_actions,
+                            'first_sequence': first_sequence, 'first_node': first_node})
+
+        # One top-down pass: each node's last sequence per player and chance reach
+        edge_parent = np.repeat(np.arange(n), counts)
+        rank = np.arange(len(child)) - child_start[edge_parent]
+        sequence = np.zeros((n, 2), dtype=np.int64)
+        chance_reach = np.ones(n)
+        root = int(np.flatnonzero(arrays['parent'] == -1)[0])
+        frontier = np.array([root])
+        while len(frontier):
+            frontier = np.sort(frontier[counts[frontier] > 0])
+            if not len(frontier):
+                break
+            sizes = counts[frontier]
+            starts = np.cumsum(sizes) - sizes
+            edges = np.repeat(child_start[frontier] - starts, sizes) + np.arange(sizes.sum())
+            parents, kids = edge_parent[edges], child[edges]
+            sequence[kids] = sequence[parents]
+            chance_reach[kids] = chance_reach[parents]
+            for p in range(2):
+                mine = (kind[parents] == DECISION) & (player[parents] == p)
+                infosets = node_infoset[parents[mine]]
+                sequence[kids[mine], p] = layouts[p]['first_sequence'][infosets] + rank[edges[mine]]
+            chance = kind[parents] == CHANCE
+            chance_reach[kids[chance]] *= arrays['probability'][edges[chance]]
+            frontier = kids
+
+        constraints = []
+        for p, layout in enumerate(layouts):
+            parent_sequence = np.zeros(len(layout['num_actions']), dtype=np.int64)
+            parent_sequence[layout['infoset']] = sequence[layout['nodes'], p]
+            if np.any(parent_sequence[layout['infoset']] != sequence[layout['nodes'], p]):
+                raise ValueError(f"Player {p + 1} does not have perfect recall")
+            layout['parent_sequence'] = parent_sequence
+            num_sequences = int(layout['first_sequence'][-1])
+            layout['num_sequences'] = num_sequences
+
+            # Row 0: the empty sequence has realization 1; row 1+I: actions of I sum to I's parent sequence
+            rows = np.concatenate([[0], 1 + np.arange(len(parent_sequence)),
+                                   1 + np.repeat(np.arange(len(parent_sequence)), layout['num_actions'])])
+            cols = np.concatenate([[0], parent_sequence, np.arange(1, num_sequences)])
+            data = np.concatenate([[1.0], -np.ones(len(parent_sequence)), np.ones(num_sequences - 1)])
+            matrix = coo_matrix((data, (rows, cols)), shape=(len(parent_sequence) + 1, num_sequences)).tocsr()
+            rhs = np.zeros(len(parent_sequence) + 1)
+            rhs[0] = 1
+            constraints.append((matrix, rhs))
+
+        leaves = np.flatnonzero(terminal)
+        A = coo_matrix((chance_reach[leaves] * payoffs[leaves, 0], (sequence[leaves, 0], sequence[leaves, 1])),
+                       shape=(layouts[0]['num_sequences'], layouts[1]['num_sequences'])).tocsr()
+        (E, e), (F, f) = constraints
+        return {'E': E, 'e': e, 'F': F, 'f': f, 'A': A, 'layouts': layouts}
+
+    @staticmethod
+    def solve(tree):
+        """Equilibrium of a two-player zero-sum GameTree with a single HiGHS LP
+
+        Player 1's realization plan comes from the primal and Player 2's from the
+        duals of the same solve. Returns 'value' (Player 1's expected payoff),
+        behavioural strategies 'Player 1' and 'Player 2' as
+        {(player, information set key): {action: probability}}, and the
+        realization plans under 'realization'.
+        """
+        from scipy.optimize import linprog
+        from scipy.sparse import hstack, csr_matrix
+
+        data = SequenceFormSolver.build(tree)
+        E, e, F, f, A = data['E'], data['e'], data['F'], data['f'], data['A']
+        num_x, num_q = E.shape[1], F.shape[0]
+
+        # max f.q  s.t.  F^T q <= A^T x,  E x = e,  x >= 0, q free
+        c = np.concatenate([np.zeros(num_x), -f])
+        A_ub = hstack([-A.T, F.T]).tocsr()
+        A_eq = hstack([E, csr_matrix((E.shape[0], num_q))]).tocsr()
+        bounds = [(0, None)] * num_x + [(None, None)] * num_q
+        res = linprog(c, A_ub=A_ub, b_ub=np.zeros(A_ub.shape[0]), A_eq=A_eq, b_eq=e,
+                      bounds=bounds, method='highs')
+        if not res.success:
+            raise ValueError(f"Sequence-form LP failed: {res.message}")
+
+        x = np.maximum(res.x[:num_x], 0)
+        # The duals of the best-response constraints are Player 2's realization plan
+        y = np.maximum(-res.ineqlin.marginals, 0)
+        return {
+            'value': float(-res.fun),
+            'Player 1': SequenceFormSolver._behavioural(tree, data['layouts'][0], x),
+            'Player 2': SequenceFormSolver._behavioural(tree, data['layouts'][1], y),
+            'realization': (x, y)
+        }
+
+    @staticmethod
+    def _behavioural(tree, layout, plan):
+        """Per-information-set action probabilities from a realization plan (uniform where unreachable)"""
+        strategy = {}
+        for infoset, node in enumerate(layout['first_node'].tolist()):
+            start, k = layout['first_sequence'][infoset], layout['num_actions'][infoset]
+            reach = plan[layout['parent_sequence'][infoset]]
+            if reach > SequenceFormSolver.TOL:
+                probs = plan[start:start + k] / reach
+                probs = probs / probs.sum()
+            else:
+                probs = np.full(k, 1.0 / k)
+            strategy[tree.infoset_key(node)] = dict(zip(tree.actions(node), probs.tolist()))
+        return strategy
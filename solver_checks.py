@@ -0,0 +1,78 @@
+"""Cross-checks of the equilibrium solvers on games with known answers
+
+Kuhn poker has value -1/18 for Player 1: the sequence-form LP must hit it and
+CFR+ must get close with a small NashConv. On random bimatrix games every
+Lemke-Howson start (each dropped label) must end at a Nash equilibrium that
+support enumeration also finds. Run `python solver_checks.py` (exit status 1 on
+a failure); the random games are seeded, so failures reproduce.
+"""
+import sys
+import numpy as np
+from bimatrix import BimatrixSolver
+from cfr import CFRSolver
+from kuhn_poker import KuhnPoker
+from sequence_form import SequenceFormSolver
+
+TOL = 1e-6
+CFR_ITERATIONS = 2000
+# CFR+ after CFR_ITERATIONS iterations: allowed distance from the value and NashConv
+CFR_TOL = 5e-3
+RANDOM_SHAPES = ((2, 2), (3, 3), (3, 4), (4, 4), (5, 3))
+RANDOM_GAMES = 40
+
+
+def check_kuhn():
+    """[(name, ok, detail)] for the sequence-form LP and CFR+ on three-card Kuhn poker"""
+    tree = KuhnPoker().extensive_form()
+    value = float(KuhnPoker.VALUE)
+    cfr = CFRSolver(tree)
+
+    lp = SequenceFormSolver.solve(tree)
+    lp_gap = cfr.nash_conv(cfr.strategy_from_policy({**lp['Player 1'], **lp['Player 2']}))
+    results = [('kuhn sequence-form value', abs(lp['value'] - value) <= TOL and lp_gap <= TOL,
+                f"value {lp['value']:.6f}, NashConv {lp_gap:.2e}")]
+
+    solution = cfr.solve(CFR_ITERATIONS, method='cfr+')
+    cfr_value = cfr.expected_payoffs()[0]
+    ok = abs(cfr_value - value) <= CFR_TOL and solution['nash_conv'] <= CFR_TOL
+    results.append(('kuhn cfr+ value', ok, f"value {cfr_value:.6f}, NashConv {solution['nash_conv']:.2e}"))
+    return results
+
+
+def is_equilibrium(A, B, x, y):
+    """Neither player gains more than TOL by deviating from (x, y)"""
+    return (A @ y).max() - x @ A @ y <= TOL and (x @ B).max() - x @ B @ y <= TOL
+
+
+def check_bimatrix(seed=0):
+    """[(name, ok, detail)] comparing Lemke-Howson from every label with support enumeration"""
+    rng = np.random.default_rng(seed)
+    results = []
+    for m, n in RANDOM_SHAPES:
+        failures = []
+        for game in range(RANDOM_GAMES):
+            # Continuous random payoffs give nondegenerate games with probability one
+            A, B = rng.standard_normal((m, n)), rng.standard_normal((m, n))
+            enumerated = list(BimatrixSolver.support_enumeration(A, B))
+            if len(enumerated) % 2 == 0 or not all(is_equilibrium(A, B, x, y) for x, y in enumerated):
+                failures.append(f"game {game}: support enumeration found {len(enumerated)} equilibria")
+                continue
+            for label in range(m + n):
+                x, y = BimatrixSolver.lemke_howson(A, B, initial_dropped_label=label)
+                known = any(np.allclose(x, ex, atol=TOL) and np.allclose(y, ey, atol=TOL) for ex, ey in enumerated)
+                if not (is_equilibrium(A, B, x, y) and known):
+                    failures.append(f"game {game}: Lemke-Howson from label {label}")
+        detail = failures[0] if failures else f"{RANDOM_GAMES} games, all {m + n} labels"
+        results.append((f"lemke-howson vs support enumeration {m}x{n}", not failures, detail))
+    return results
+
+
+def main():
+    results = check_kuhn() + check_bimatrix()
+    for name, ok, detail in results:
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<42} {detail}")
+    return 0 if all(ok for _, ok, _ in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
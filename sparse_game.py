@@ -0,0 +1,166 @@
+from collections import OrderedDict
+from itertools import islice, product
+from math import prod
+
+
+class SparseGame:
+    """N-player game whose payoffs are never stored densely
+
+    Payoffs come either from payoff_fn(profile) -> tuple, or from a table holding
+    only the profiles that differ from a default payoff. Profiles are evaluated
+    lazily, so games with billions of nominal profiles can still be queried.
+    """
+
+    CACHE_SIZE = 100000
+
+    def __init__(self, players, strategies, payoff_fn=None, table=None, default=0, upper_bounds=None):
+        if (payoff_fn is None) == (table is None):
+            raise ValueError("Give exactly one of payoff_fn or table")
+        self.players = players
+        self.strategies = [list(strats) for strats in strategies]
+        self.payoff_fn = payoff_fn
+        self.table = table
+        num_players = len(self.strategies)
+        self.default = tuple(default) if isinstance(default, (tuple, list)) else (default,) * num_players
+
+        if table is not None:
+            self._index_table()
+            if upper_bounds is None:
+                upper_bounds = [max([self.default[player]] + [payoffs[player] for payoffs in table.values()])
+                                for player in range(num_players)]
+        # upper_bounds[player] is the most that player can ever get; reaching it skips the deviation scan
+        self.upper_bounds = upper_bounds
+        self._br_cache = OrderedDict()
+
+    @property
+    def num_players(self):
+        return len(self.strategies)
+
+    @property
+    def num_profiles(self):
+        return prod(len(strats) for strats in self.strategies)
+
+    def get_payoff(self, profile):
+        if self.table is not None:
+            return self.table.get(profile, self.default)
+        return self.payoff_fn(profile)
+
+    def _index_table(self):
+        """Per player, the best table payoff and entry count for every opponent profile that appears"""
+        self._row_best = [{} for _ in self.strategies]
+        for profile, payoffs in self.table.items():
+            for player in range(self.num_players):
+                opponents = profile[:player] + profile[player + 1:]
+                best, count = self._row_best[player].get(opponents, (-float('inf'), 0))
+                self._row_best[player][opponents] = (max(best, payoffs[player]), count + 1)
+
+    def best_response_value(self, player, profile):
+        """Highest payoff the player can reach by changing only their own strategy"""
+        opponents = profile[:player] + profile[player + 1:]
+        if self.table is not None:
+            best, count = self._row_best[player].get(opponents, (-float('inf'), 0))
+            # Any strategy missing from the table earns the default payoff
+            if count < len(self.strategies[player]):
+                best = max(best, self.default[player])
+            return best
+
+        key = (player, opponents)
+        if key in self._br_cache:
+            self._br_cache.move_to_end(key)
+            return self._br_cache[key]
+        best = -float('inf')
+        bound = self.upper_bounds[player] if self.upper_bounds is not None else float('inf')
+        for strategy in self.strategies[player]:
+            best = max(best, self.payoff_fn(opponents[:player] + (strategy,) + opponents[player:])[player])
+            if best >= bound:
+                break
+        self._br_cache[key] = best
+        if len(self._br_cache) > self.CACHE_SIZE:
+            self._br_cache.popitem(last=False)
+        return best
+
+    def is_equilibrium(self, profile):
+        payoffs = self.get_payoff(profile)
+        for player in range(self.num_players):
+            # A player already at their upper bound cannot gain by deviating
+            if self.upper_bounds is not None and payoffs[player] >= self.upper_bounds[player]:
+                continue
+            if self.best_response_value(player, profile) > payoffs[player]:
+                return False
+        return True
+
+    def iter_pure_equilibria(self, candidates=None, limit=None):
+        """Lazily yield pure equilibria
+
+        Only the given candidate profiles are checked if provided. Otherwise table
+        games yield from pure_equilibria(), whose default region needs no checks,
+        and callable games walk every profile in order. Stops after `limit` equilibria.
+        """
+        if candidates is None and self.table is not None:
+            equilibria = iter(self.pure_equilibria())
+        else:
+            profiles = product(*self.strategies) if candidates is None else candidates
+            equilibria = (profile for profile in profiles if self.is_equilibrium(profile))
+        yield from islice(equilibria, limit)
+
+    def pure_equilibria(self):
+        """All pure equilibria of a table game as a ProfileRegion, without visiting the default region
+
+        A profile outside the table pays the default, so it fails only when some
+        player can reach a better table payoff by deviating. Those profiles lie on
+        the lines through the opponent profiles where a table entry beats the
+        default, so the region is every profile minus the table and those lines.
+        """
+        if self.table is None:
+            raise ValueError("Only table games have a structured default region")
+        excluded = set(self.table)
+        for player, row_best in enumerate(self._row_best):
+            for opponents, (best, _) in row_best.items():
+                if best > self.default[player]:
+                    excluded.update(opponents[:player] + (strategy,) + opponents[player:]
+                                    for strategy in self.strategies[player])
+        listed = [profile for profile in self.table if self.is_equilibrium(profile)]
+        return ProfileRegion(self.strategies, excluded, listed)
+
+    def find_nash_equilibrium(self, limit=None):
+        """Pure equilibria: a ProfileRegion for table games, else (or with a limit) a list"""
+        if limit is None and self.table is not None:
+            return self.pure_equilibria()
+        return list(self.iter_pure_equilibria(limit=limit))
+
+
+class ProfileRegion:
+    """Compact set of pure profiles: `listed` ones plus every profile not in `excluded`
+
+    Size and membership are answered from the two explicit sets; iterating
+    yields the listed profiles and then walks the product lazily.
+    """
+
+    def __init__(self, strategies, excluded, listed=()):
+        self.strategies = strategies
+        self.excluded = frozenset(excluded)
+        self.listed = list(listed)
+        self._valid = [set(strats) for strats in strategies]
+
+    @property
+    def size(self):
+        return prod(len(strats) for strats in self.strategies) - len(self.excluded) + len(self.listed)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, profile):
+        profile = tuple(profile)
+        if profile in self.excluded:
+            return profile in self.listed
+        return len(profile) == len(self._valid) and all(s in valid for s, valid in zip(profile, self._valid))
+
+    def __iter__(self):
+        yield from self.listed
+        for profile in product(*self.strategies):
+            if profile not in self.excluded:
+                yield profile
+
+    def __repr__(self):
+        return (f"ProfileRegion({self.size} profiles: {len(self.listed)} listed, "
+                f"all others except {len(self.excluded)} excluded)")
@@ -0,0 +1,93 @@
+import os
+import numpy as np
+from game_analyzer import GameAnalyzer
+
+
+class ParameterSweep:
+    """Solve a parameterized 2x2 game over a whole grid of parameter values
+
+    payoff_fn(**params) receives one flat array per parameter and must return the
+    matching stack of payoff tensors of shape (B, 2, 2, 2), so a grid is built and
+    solved in a few vectorized steps instead of one game object per cell.
+    """
+
+    def __init__(self, payoff_fn, grid, strategies=None):
+        self.payoff_fn = payoff_fn
+        self.names = list(grid)
+        self.axes = [np.asarray(values, dtype=float).ravel() for values in grid.values()]
+        self.strategies = strategies or [['0', '1'], ['0', '1']]
+
+    @property
+    def size(self):
+        return int(np.prod([len(axis) for axis in self.axes]))
+
+    def parameters(self):
+        """Flat column per parameter covering the Cartesian product of the grid"""
+        mesh = np.meshgrid(*self.axes, indexing='ij')
+        return {name: values.ravel() for name, values in zip(self.names, mesh)}
+
+    def run(self, processes=None, chunk_size=100000):
+        """Solve every grid point and return a dict of equal-length columns
+
+        The grid is cut into chunks of chunk_size points; with more than one
+        chunk, chunks are solved across worker processes unless processes=1.
+        """
+        params = self.parameters()
+        bounds = list(range(0, self.size, chunk_size)) + [self.size]
+        chunks = [{name: values[start:stop] for name, values in params.items()}
+                  for start, stop in zip(bounds[:-1], bounds[1:])]
+        tasks = [(self.payoff_fn, chunk, self.strategies) for chunk in chunks]
+
+        if processes == 1 or len(tasks) < 2:
+            parts = list(map(ParameterSweep._solve_chunk, tasks))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            workers = processes or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(ParameterSweep._solve_chunk, tasks))
+
+        if not parts:
+            return {}
+        return {column: np.concatenate([part[column] for part in parts]) for column in parts[0]}
+
+    @staticmethod
+    def _solve_chunk(task):
+        payoff_fn, params, strategies = task
+        payoffs = np.asarray(payoff_fn(**params), dtype=float)
+        solution = GameAnalyzer.solve_2x2_batch(payoffs)
+        (r1, r2), (c1, c2) = strategies
+
+        columns = dict(params)
+        columns['num_pure'] = solution['pure'].sum(axis=(1, 2))
+        for i, s1 in enumerate((r1, r2)):
+            for j, s2 in enumerate((c1, c2)):
+                columns[f'pure_{s1}_{s2}'] = solution['pure'][:, i, j]
+
+        # Fully mixed equilibrium: first-strategy probabilities and expected payoffs, NaN where absent
+        has_mixed = solution['has_mixed']
+        p = np.where(has_mixed, solution['mixed'][:, 0], np.nan)
+        q = np.where(has_mixed, solution['mixed'][:, 1], np.nan)
+        x = np.stack([p, 1 - p], axis=1)
+        y = np.stack([q, 1 - q], axis=1)
+        columns['has_mixed'] = has_mixed
+        columns[f'p1_{r1}'] = p
+        columns[f'p2_{c1}'] = q
+        columns['payoff_p1'] = np.einsum('bi,bij,bj->b', x, payoffs[..., 0], y)
+        columns['payoff_p2'] = np.einsum('bi,bij,bj->b', x, payoffs[..., 1], y)
+        return columns
+
+    @staticmethod
+    def save(result, path):
+        """Write sweep columns to .npz, or to .parquet when pyarrow is installed"""
+        path = str(path)
+        if path.endswith('.npz'):
+            np.savez_compressed(path, **result)
+        elif path.endswith('.parquet'):
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Writing Parquet needs pyarrow; save to a .npz path instead") from None
+            pq.write_table(pa.table({name: np.asarray(values) for name, values in result.items()}), path)
+        else:
+            raise ValueError(f"Unsupported sweep output format: {path}")
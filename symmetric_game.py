@@ -0,0 +1,151 @@
+import numpy as np
+from itertools import combinations
+from math import lgamma
+from payoff_tensor import PayoffTensor
+
+
+class SymmetricGame:
+    """Game of identical, anonymous players
+
+    A player's payoff depends only on its own strategy and on how many of the
+    other players use each strategy, so payoffs are stored per count configuration:
+    table[c, s] is the payoff for playing s when the others' counts are configs[c].
+    That is C(N+|S|-2, |S|-1) rows instead of |S|^N profiles.
+    """
+
+    def __init__(self, strategies, num_players, table):
+        self.strategies = list(strategies)
+        self.num_players = num_players
+        self.configs = SymmetricGame.count_configurations(num_players - 1, len(self.strategies))
+        self.config_index = {tuple(c): i for i, c in enumerate(self.configs.tolist())}
+        self.table = np.asarray(table, dtype=float)
+        if self.table.shape != (len(self.configs), len(self.strategies)):
+            raise ValueError(f"Payoff table has shape {self.table.shape}, "
+                             f"expected {(len(self.configs), len(self.strategies))}")
+
+        # log of the multinomial coefficient (N-1)! / prod(c_t!) for each configuration
+        self._log_multinomial = np.array([
+            lgamma(num_players) - sum(lgamma(count + 1) for count in config) for config in self.configs.tolist()
+        ])
+
+    @staticmethod
+    def count_configurations(total, num_strategies):
+        """Every way to split `total` players over the strategies (stars and bars), as an array"""
+        configs = []
+        for bars in combinations(range(total + num_strategies - 1), num_strategies - 1):
+            edges = (-1,) + bars + (total + num_strategies - 1,)
+            configs.append([edges[k + 1] - edges[k] - 1 for k in range(num_strategies)])
+        return np.array(configs, dtype=int).reshape(-1, num_strategies)
+
+    @classmethod
+    def from_function(cls, strategies, num_players, payoff_fn):
+        """payoff_fn(own_strategy, counts) gets counts as a {strategy: count} dict of the other players"""
+        configs = cls.count_configurations(num_players - 1, len(strategies))
+        table = [[payoff_fn(own, dict(zip(strategies, config))) for own in strategies]
+                 for config in configs.tolist()]
+        return cls(strategies, num_players, table)
+
+    @classmethod
+    def from_game(cls, game):
+        """Compress a symmetric 2-player game (dict, PayoffTensor or bundled game object)"""
+        game = PayoffTensor.from_game(game)
+        A, B = game.payoffs[..., 0], game.payoffs[..., 1]
+        if game.num_players != 2 or game.strategies[0] != game.strategies[1] or not np.array_equal(A, B.T):
+            raise ValueError("Game is not a symmetric 2-player game")
+        # With one opponent, configuration c is the unit vector of the opponent's strategy
+        configs = cls.count_configurations(1, len(game.strategies[0]))
+        table = configs @ A.T
+        return cls(game.strategies[0], 2, table)
+
+    def get_payoff(self, strategy, other_counts):
+        """Payoff for playing `strategy` when the others' counts are given as a dict or sequence"""
+        if isinstance(other_counts, dict):
+            other_counts = [other_counts.get(s, 0) for s in self.strategies]
+        return float(self.table[self.config_index[tuple(other_counts)], self.strategies.index(strategy)])
+
+    def pure_equilibria(self):
+        """Count configurations of all N players in which no one gains by switching"""
+        equilibria = []
+        k = len(self.strategies)
+        for config in self.count_configurations(self.num_players, k).tolist():
+            stable = True
+            for s in range(k):
+                if config[s] == 0:
+                    continue
+                others = list(config)
+                others[s] -= 1
+                values = self.table[self.config_index[tuple(others)]]
+                if values.max() > values[s]:
+                    stable = False
+                    break
+            if stable:
+                equilibria.append(dict(zip(self.strategies, config)))
+        return equilibria
+
+    def strategy_payoffs(self, mixed):
+        """Payoff of each pure strategy when every other player mixes according to `mixed`
+
+        mixed may be one probability vector or a batch of shape (P, |S|).
+        """
+        mixed = np.asarray(mixed, dtype=float)
+        # Clamping log(0) keeps 0 * log(0) at zero while sending every
+        # configuration that uses an unplayed strategy to zero weight
+        log_mixed = np.log(np.maximum(mixed, 1e-300))
+        weights = np.exp(self._log_multinomial + log_mixed @ self.configs.T)
+        return weights @ self.table
+
+    def expected_payoff(self, mixed):
+        """Payoff of a player in the symmetric profile where everyone plays `mixed`"""
+        mixed = np.asarray(mixed, dtype=float)
+        return np.sum(self.strategy_payoffs(mixed) * mixed, axis=-1)
+
+    def find_symmetric_equilibria(self, starts=16, steps=5000, dt=0.1, tol=1e-6, seed=None):
+        """Symmetric mixed equilibria found by batched replicator dynamics from random starts
+
+        All starts are integrated together and each one is frozen once it settles.
+        Endpoints (and every pure strategy) whose regret, the best pure payoff
+        minus the mixed payoff, is within tol times the payoff range are
+        returned, deduplicated.
+        """
+        rng = np.random.default_rng(seed)
+        k = len(self.strategies)
+        scale = self._payoff_scale()
+
+        population = rng.dirichlet(np.ones(k), size=starts)
+        active = np.arange(starts)
+        for step in range(steps):
+            current = population[active]
+            fitness = self.strategy_payoffs(current)
+            mean = np.sum(current * fitness, axis=1, keepdims=True)
+            velocity = current * (fitness - mean) / scale
+            if step % 50 == 0:
+                unsettled = fitness.max(axis=1) - mean[:, 0] > tol * scale
+                active, current, velocity = active[unsettled], current[unsettled], velocity[unsettled]
+                if len(active) == 0:
+                    break
+            # Velocity is scaled by the payoff range so dt does not depend on payoff units
+            current = np.clip(current + dt * velocity, 0, None)
+            population[active] = current / current.sum(axis=1, keepdims=True)
+
+        # Vertices are rest points of the dynamics, so pure strategies are checked
+        # directly, and first, so exact pure equilibria win the deduplication
+        population = np.vstack([np.eye(k), population])
+        fitness = self.strategy_payoffs(population)
+        regrets = fitness.max(axis=1) - np.sum(population * fitness, axis=1)
+
+        equilibria = []
+        for mixed, regret in zip(population, regrets):
+            if regret > tol * scale:
+                continue
+            if any(np.allclose(mixed, known['probs'], atol=1e-3) for known in equilibria):
+                continue
+            equilibria.append({'probs': mixed, 'regret': float(regret)})
+        return [
+            {'strategy': {s: float(p) for s, p in zip(self.strategies, eq['probs'])}, 'regret': eq['regret']}
+            for eq in equilibria
+        ]
+
+    def _payoff_scale(self):
+        """Range of the payoff table, used to normalize replicator steps"""
+        spread = self.table.max() - self.table.min()
+        return spread if spread > 0 else 1.0
@@ -0,0 +1,260 @@
+import os
+import numpy as np
+from itertools import product
+
+# Moves are encoded as 0 = Cooperate, 1 = Defect
+COOPERATE, DEFECT = 0, 1
+
+
+class Strategy:
+    """Repeated Prisoner's Dilemma strategy as a finite-state machine
+
+    coop_probs[state] is the probability of cooperating in a state and
+    transitions[state][my_move][their_move] is the next state.
+    """
+
+    def __init__(self, name, coop_probs, transitions, initial_state=0):
+        self.name = name
+        self.coop_probs = [float(p) for p in coop_probs]
+        self.transitions = [[list(row) for row in state] for state in transitions]
+        self.initial_state = initial_state
+        self.deterministic = all(p in (0.0, 1.0) for p in self.coop_probs)
+        self.key = (tuple(self.coop_probs),
+                    tuple(tuple(tuple(row) for row in state) for state in self.transitions),
+                    initial_state)
+
+    def __repr__(self):
+        return f"Strategy({self.name!r})"
+
+    @classmethod
+    def from_lookup_table(cls, name, table, memory=1, opening='C'):
+        """Finite-memory strategy from a lookup table over the last `memory` rounds
+
+        table has 4**memory entries ('C', 'D' or a cooperation probability). The
+        history code of a round is 2 * my_move + their_move, and older rounds occupy
+        the higher base-4 digits. Rounds before the start count as mutual cooperation.
+        """
+        size = 4 ** memory
+        if len(table) != size:
+            raise ValueError(f"A memory-{memory} lookup table needs {size} entries, got {len(table)}")
+
+        # States 0..size-1 are histories, state `size` is the opening move
+        coop_probs = [Strategy._as_prob(entry) for entry in table] + [Strategy._as_prob(opening)]
+        transitions = [
+            [[(history * 4 + 2 * mine + theirs) % size for theirs in (0, 1)] for mine in (0, 1)]
+            for history in list(range(size)) + [0]
+        ]
+        return cls(name, coop_probs, transitions, initial_state=size)
+
+    @staticmethod
+    def _as_prob(entry):
+        if entry == 'C':
+            return 1.0
+        if entry == 'D':
+            return 0.0
+        return float(entry)
+
+
+class StrategyLibrary:
+    """Classic strategies from Axelrod's tournaments"""
+
+    @staticmethod
+    def always_cooperate():
+        return Strategy.from_lookup_table('Always Cooperate', 'CCCC', opening='C')
+
+    @staticmethod
+    def always_defect():
+        return Strategy.from_lookup_table('Always Defect', 'DDDD', opening='D')
+
+    @staticmethod
+    def tit_for_tat():
+        # Copy the opponent's last move (history codes CC, CD, DC, DD)
+        return Strategy.from_lookup_table('Tit For Tat', 'CDCD', opening='C')
+
+    @staticmethod
+    def suspicious_tit_for_tat():
+        return Strategy.from_lookup_table('Suspicious Tit For Tat', 'CDCD', opening='D')
+
+    @staticmethod
+    def pavlov():
+        # Win-stay, lose-shift: cooperate after matching moves
+        return Strategy.from_lookup_table('Pavlov', 'CDDC', opening='C')
+
+    @staticmethod
+    def grim_trigger():
+        # State 0 cooperates until the opponent defects once, state 1 defects forever
+        return Strategy('Grim Trigger', [1, 0], [[[0, 1], [0, 1]], [[1, 1], [1, 1]]])
+
+    @staticmethod
+    def random(coop_prob=0.5):
+        return Strategy(f'Random({coop_prob})', [coop_prob], [[[0, 0], [0, 0]]])
+
+    @staticmethod
+    def all_memory_one():
+        """All 16 deterministic memory-one strategies (opening with cooperation)"""
+        return [Strategy.from_lookup_table(f"Memory-1 {''.join(table)}", table)
+                for table in product('CD', repeat=4)]
+
+    @staticmethod
+    def classics():
+        return [
+            StrategyLibrary.always_cooperate(),
+            StrategyLibrary.always_defect(),
+            StrategyLibrary.tit_for_tat(),
+            StrategyLibrary.suspicious_tit_for_tat(),
+            StrategyLibrary.pavlov(),
+            StrategyLibrary.grim_trigger(),
+            StrategyLibrary.random(),
+        ]
+
+
+class Tournament:
+    """Round-robin repeated Prisoner's Dilemma tournament
+
+    payoffs maps (move, move) profiles to payoff pairs. moves names the stage
+    game's (cooperate, defect) moves in that order and defaults to the
+    strategies of PrisonersDilemma.
+    """
+
+    def __init__(self, strategies, payoffs=None, rounds=1000, repetitions=1, noise=0.0, seed=None, moves=None):
+        if payoffs is None or moves is None:
+            from prisoners_dilemma import PrisonersDilemma
+            game = PrisonersDilemma()
+            payoffs = game.payoffs if payoffs is None else payoffs
+            moves = game.strategies if moves is None else moves
+        moves = list(moves)
+        if len(moves) != 2 or moves[0] == moves[1]:
+            raise ValueError(f"moves must name two distinct moves (cooperate, defect), got {moves}")
+        missing = [(a, b) for a in moves for b in moves if (a, b) not in payoffs]
+        if missing:
+            raise ValueError(f"The payoffs have no entry for {missing}; pass moves= to name the stage game's moves")
+
+        self.strategies = list(strategies)
+        # payoff_table[my_move][their_move] -> (my payoff, their payoff)
+        self.payoff_table = [[tuple(payoffs[(moves[a], moves[b])]) for b in (0, 1)] for a in (0, 1)]
+        self.rounds = rounds
+        self.repetitions = repetitions
+        self.noise = noise
+        self.seed = seed
+        self._match_cache = {}
+
+    def play(self, processes=None):
+        """Play every pairing (including self-play) and return mean per-round scores
+
+        Deterministic pairings are played once and cached; the rest are played
+        `repetitions` times. Repetition r of pairing (i, j) always draws from the
+        stream keyed (i, j, r) under the tournament seed, so results depend
+        neither on how matches are spread across worker processes nor on what
+        earlier calls left in the cache.
+        """
+        n = len(self.strategies)
+        pairs = [(i, j) for i in range(n) for j in range(i, n)]
+
+        # Each distinct deterministic pairing is played once; stochastic ones once per repetition
+        jobs, scheduled = [], set()
+        for i, j in pairs:
+            s1, s2 = self.strategies[i], self.strategies[j]
+            if self._is_deterministic(s1, s2):
+                key = (s1.key, s2.key)
+                if key not in self._match_cache and key not in scheduled:
+                    scheduled.add(key)
+                    jobs.append((i, j, 0))
+            else:
+                jobs.extend((i, j, r) for r in range(self.repetitions))
+        tasks = [(self.strategies[i], self.strategies[j], self.rounds, self.payoff_table, self.noise,
+                  np.random.SeedSequence(self.seed, spawn_key=(i, j, r)))
+                 for i, j, r in jobs]
+
+        if processes == 1 or len(tasks) < 2:
+            outcomes = list(map(Tournament._play_match, tasks))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            workers = processes or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(Tournament._play_match, tasks,
+                                         chunksize=max(1, len(tasks) // (4 * workers))))
+
+        totals = {}
+        for (i, j, _), outcome in zip(jobs, outcomes):
+            s1, s2 = self.strategies[i], self.strategies[j]
+            if self._is_deterministic(s1, s2):
+                self._match_cache[(s1.key, s2.key)] = outcome
+            else:
+                total = totals.setdefault((i, j), [0.0, 0.0])
+                total[0] += outcome[0] / self.repetitions
+                total[1] += outcome[1] / self.repetitions
+
+        scores = np.zeros((n, n))
+        for i, j in pairs:
+            s1, s2 = self.strategies[i], self.strategies[j]
+            if self._is_deterministic(s1, s2):
+                score1, score2 = self._match_cache[(s1.key, s2.key)]
+            else:
+                score1, score2 = totals[(i, j)]
+            if i == j:
+                # Both seats of a self-play match belong to the same strategy
+                scores[i, i] = (score1 + score2) / (2 * self.rounds)
+            else:
+                scores[i, j] = score1 / self.rounds
+                scores[j, i] = score2 / self.rounds
+
+        mean_scores = scores.mean(axis=1)
+        ranking = [self.strategies[k].name for k in np.argsort(-mean_scores, kind='stable')]
+        return {'scores': scores, 'mean_scores': mean_scores, 'ranking': ranking}
+
+    def _is_deterministic(self, s1, s2):
+        return self.noise == 0 and s1.deterministic and s2.deterministic
+
+    @staticmethod
+    def _play_match(task):
+        """Total payoffs of both players over one match"""
+        s1, s2, rounds, table, noise, stream = task
+        if noise == 0 and s1.deterministic and s2.deterministic:
+            return Tournament._play_deterministic(s1, s2, rounds, table)
+
+        rng = np.random.default_rng(stream)
+        draws = rng.random((rounds, 2)).tolist()
+        flips = (rng.random((rounds, 2)) < noise).tolist() if noise else [(False, False)] * rounds
+
+        p1, p2 = s1.coop_probs, s2.coop_probs
+        t1, t2 = s1.transitions, s2.transitions
+        a, b = s1.initial_state, s2.initial_state
+        total1 = total2 = 0
+        for (u1, u2), (f1, f2) in zip(draws, flips):
+            m1 = COOPERATE if u1 < p1[a] else DEFECT
+            m2 = COOPERATE if u2 < p2[b] else DEFECT
+            # Noise flips the intended move
+            if f1:
+                m1 = 1 - m1
+            if f2:
+                m2 = 1 - m2
+            r1, r2 = table[m1][m2]
+            total1 += r1
+            total2 += r2
+            a, b = t1[a][m1][m2], t2[b][m2][m1]
+        return total1, total2
+
+    @staticmethod
+    def _play_deterministic(s1, s2, rounds, table):
+        """Play until the joint state repeats, then extrapolate the cycle arithmetically"""
+        a, b = s1.initial_state, s2.initial_state
+        seen = {}
+        cumulative = [(0, 0)]
+        for t in range(rounds):
+            if (a, b) in seen:
+                start = seen[(a, b)]
+                period = t - start
+                cycle = (cumulative[t][0] - cumulative[start][0], cumulative[t][1] - cumulative[start][1])
+                full, rest = divmod(rounds - t, period)
+                tail = (cumulative[start + rest][0] - cumulative[start][0],
+                        cumulative[start + rest][1] - cumulative[start][1])
+                return (cumulative[t][0] + full * cycle[0] + tail[0],
+                        cumulative[t][1] + full * cycle[1] + tail[1])
+            seen[(a, b)] = t
+
+            m1 = COOPERATE if s1.coop_probs[a] == 1.0 else DEFECT
+            m2 = COOPERATE if s2.coop_probs[b] == 1.0 else DEFECT
+            r1, r2 = table[m1][m2]
+            cumulative.append((cumulative[t][0] + r1, cumulative[t][1] + r2))
+            a, b = s1.transitions[a][m1][m2], s2.transitions[b][m2][m1]
+        return cumulative[rounds]
@@ -0,0 +1,101 @@
+import numpy as np
+
+
+class ZeroSumSolver:
+    """Value and optimal strategies of two-player constant-sum matrix games
+
+    A constant-sum game (A + B = c everywhere) is strategically the zero-sum game
+    A, so only Player 1's matrix is needed. Small and medium games are solved
+    exactly with one minimax LP whose duals give Player 2's strategy; very large
+    (or sparse) matrices can use a first-order extragradient method that only
+    needs matrix-vector products.
+    """
+
+    TOL = 1e-9
+    # Above this many entries the default route is the first-order method
+    LARGE = 1000000
+
+    @staticmethod
+    def constant(A, B, tol=None):
+        """The constant c with A + B == c everywhere, or None if the game is not constant-sum"""
+        total = np.asarray(A, dtype=float) + np.asarray(B, dtype=float)
+        if total.size == 0:
+            return None
+        tol = ZeroSumSolver.TOL * max(1.0, np.abs(total).max()) if tol is None else tol
+        if total.max() - total.min() > tol:
+            return None
+        return float(total.flat[0])
+
+    @staticmethod
+    def solve(A, method=None, **kwargs):
+        """(value, x, y) for Player 1's payoff matrix A; method is 'lp' or 'extragradient'"""
+        if method is None:
+            method = 'extragradient' if np.prod(A.shape) > ZeroSumSolver.LARGE else 'lp'
+        if method == 'lp':
+            return ZeroSumSolver.minimax_lp(A)
+        if method == 'extragradient':
+            return ZeroSumSolver.extragradient(A, **kwargs)
+        raise ValueError(f"Unknown zero-sum method '{method}'")
+
+    @staticmethod
+    def minimax_lp(A):
+        """Solve max_x min_y x'Ay with one HiGHS LP; y is read off the constraint duals"""
+        from scipy.optimize import linprog
+        from scipy.sparse import csr_matrix, hstack, issparse
+
+        m, n = A.shape
+        A_csr = csr_matrix(A) if issparse(A) else np.asarray(A, dtype=float)
+        # Variables (x, v): maximise v subject to (A'x)_j >= v for every column j
+        c = np.zeros(m + 1)
+        c[-1] = -1
+        if issparse(A):
+            A_ub = hstack([-A_csr.T, csr_matrix(np.ones((n, 1)))]).tocsr()
+        else:
+            A_ub = np.hstack([-A_csr.T, np.ones((n, 1))])
+        A_eq = np.zeros((1, m + 1))
+        A_eq[0, :m] = 1
+        bounds = [(0, None)] * m + [(None, None)]
+        res = linprog(c, A_ub=A_ub, b_ub=np.zeros(n), A_eq=A_eq, b_eq=[1.0], bounds=bounds, method='highs')
+        if not res.success:
+            raise ValueError(f"Minimax LP failed: {res.message}")
+
+        x = np.maximum(res.x[:m], 0)
+        y = np.maximum(-res.ineqlin.marginals, 0)
+        return float(res.x[-1]) + 0.0, x / x.sum(), y / y.sum()  # + 0.0 drops a negative zero
+
+    @staticmethod
+    def extragradient(A, iterations=100000, tol=1e-3, check_every=50):
+        """Entropic extragradient (mirror prox) on the two simplices
+
+        Every step costs four matrix-vector products, A may be dense or sparse,
+        and the averaged iterates converge at rate O(1/T). Stops once the
+        duality gap falls below tol times the largest absolute payoff and returns the
+        value of the averaged profile with the strategies.
+        """
+        m, n = A.shape
+        scale = abs(A).max() if np.prod(A.shape) else 0.0
+        scale = scale if scale > 0 else 1.0
+        step = 1.0 / scale
+        x, y = np.full(m, 1.0 / m), np.full(n, 1.0 / n)
+        x_sum, y_sum = np.zeros(m), np.zeros(n)
+
+        def mirror_step(base, gradient):
+            # Multiplicative-weights update in log space, normalised back onto the simplex
+            logits = np.log(np.maximum(base, 1e-300)) + step * gradient
+            weights = np.exp(logits - logits.max())
+            return weights / weights.sum()
+
+        for t in range(1, iterations + 1):
+            x_half = mirror_step(x, A @ y)
+            y_half = mirror_step(y, -(A.T @ x))
+            x = mirror_step(x, A @ y_half)
+            y = mirror_step(y, -(A.T @ x_half))
+            x_sum += x_half
+            y_sum += y_half
+
+            if t % check_every == 0 or t == iterations:
+                x_avg, y_avg = x_sum / t, y_sum / t
+                gap = (A @ y_avg).max() - (A.T @ x_avg).min()
+                if gap <= tol * scale:
+                    break
+        return float(x_avg @ (A @ y_avg)), x_avg, y_avg